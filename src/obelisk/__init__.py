@@ -1,7 +1,14 @@
-from importlib.metadata import PackageNotFoundError, version
+def __getattr__(name: str) -> str:
+    # Reading installed package metadata is slow to import, so only do it when the version is actually asked for
+    if name == '__version__':
+        from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
 
+        try:
+            package_version = version('obelisk-manager')  # must match [project].name in pyproject.toml
+        except PackageNotFoundError:
+            package_version = '0.0.0-dev'  # fallback for local dev
 
-try:
-    __version__ = version('obelisk-manager')  # must match [project].name in pyproject.toml
-except PackageNotFoundError:
-    __version__ = '0.0.0-dev'  # fallback for local dev
+        globals()['__version__'] = package_version
+        return package_version
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
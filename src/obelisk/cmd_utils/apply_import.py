@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from shutil import copy2
 from typing import TYPE_CHECKING
 
 from obelisk.filetypes import registered_types, version_only_change_insensitive_types
-from obelisk.manifest import MANIFEST_FILENAME, ManifestEntry, entries_match, write_manifest
-from obelisk.scanner import create_manifest_from_folder
+from obelisk.manifest import MANIFEST_FILENAME, ManifestEntry, entries_match, read_manifest, write_manifest
+from obelisk.scanner import ScanCache, create_manifest_entry, create_manifest_from_folder
 
 
 if TYPE_CHECKING:
@@ -13,15 +16,28 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-def apply_import(
+# Dotted forms of the version-insensitive types, to compare against Path.suffix without stripping it
+_VERSION_INSENSITIVE_SUFFIXES = frozenset(f'.{ext}' for ext in version_only_change_insensitive_types)
+
+
+def apply_import(  # noqa: PLR0913 - options are keyword-only
     dest_path: Path,
     allowed: list[Path],
     *,
     dry_run: bool,
     printer: Callable[..., None] | None = None,
+    link_when_possible: bool = False,
+    trust_manifest: bool = False,
+    scan_cache: ScanCache | None = None,
 ) -> tuple[list[ManifestEntry], list[ManifestEntry]]:
     """Copy files into dest and write updated manifest.
 
+    The after state is derived from the before scan plus fresh entries for the copied files only.
+    With ``link_when_possible`` files are hard-linked rather than copied where the filesystem allows.
+    With ``trust_manifest`` an existing manifest is taken as the before state, so only the destination
+    files about to be replaced are read, rather than the whole folder.
+    A ``scan_cache`` lets the destination scan reuse the hashes of files whose stat details are unchanged.
+
     Returns a tuple of (before_entries, after_entries).
     """
 
@@ -33,35 +49,46 @@ def apply_import(
     if not dry_run:
         dest_path.mkdir(parents=True, exist_ok=True)
 
-    # Scan current state (before)
-    p('[bold]Scanning current manifest (before)...[/bold]')
-    before_entries = create_manifest_from_folder(dest_path)
+    # Establish current state (before)
+    prior_entries = read_manifest(dest_path / MANIFEST_FILENAME) if trust_manifest else None
+    if prior_entries is None:
+        p('[bold]Scanning current manifest (before)...[/bold]')
+        before_entries = create_manifest_from_folder(dest_path, scan_cache=scan_cache)
+    else:
+        p('[bold]Loading current manifest (before)...[/bold]')
+        # Re-read the files about to be replaced, as the skip check and diff need their JSON content hashes
+        prior_by_name = {entry.filename: entry for entry in prior_entries}
+        before_entries = _refresh_entries(prior_by_name, [dest_path / src.name for src in allowed])
     before_by_name = {entry.filename: entry for entry in before_entries}
 
-    # Copy files
+    # Decide which files need copying
     p('[bold]Copying files...[/bold]')
+    to_copy: list[tuple[Path, Path]] = []
+    skipped: list[Path] = []
     for src in allowed:
-        dst = dest_path / src.name
-
         # Skip copying JSON inputs when only the version changed to avoid dirty trees
-        ext = src.suffix.lstrip('.').lower()
+        # New files fail the cheap name lookup, so only files being replaced pay for the suffix and handler work
         existing_entry = before_by_name.get(src.name)
-        if ext in version_only_change_insensitive_types and existing_entry is not None:
-            handler = registered_types.get(ext)
-            prospective_entry = handler(src) if handler else None
-            if prospective_entry and entries_match(existing_entry, prospective_entry):
-                p(f'  * {src} unchanged (ignoring version); skipping copy')
-                continue
-
-        if dry_run:
-            p(f'  * {src} -> {dst} [dry-run]')
-        else:
-            copy2(src, dst)
-            p(f'  * {src} -> {dst}')
+        if existing_entry is not None and _only_version_changed(src, existing_entry):
+            skipped.append(src)
+            continue
 
-    # Scan new state (after) and write manifest
+        to_copy.append((src, dest_path / src.name))
+
+    if not dry_run:
+        _copy_files(to_copy, link=link_when_possible)
+
+    # Report in one render rather than pushing each line through Rich separately
+    lines = [f'  * {src} unchanged (ignoring version); skipping copy' for src in skipped]
+    suffix = ' [dry-run]' if dry_run else ''
+    lines.extend(f'  * {src} -> {dst}{suffix}' for src, dst in to_copy)
+    if lines:
+        p('\n'.join(lines))
+
+    # Work out the new state (after) and write manifest
     p('[bold]Updating manifest...[/bold]')
-    after_entries = create_manifest_from_folder(dest_path)
+    copied = [] if dry_run else [dst for _, dst in to_copy]
+    after_entries = _refresh_entries(before_by_name, copied)
     manifest_file = dest_path / MANIFEST_FILENAME
     if dry_run:
         p(f'  * Would write manifest: {manifest_file}')
@@ -72,4 +99,67 @@ def apply_import(
     return before_entries, after_entries
 
 
+def _only_version_changed(src: Path, existing_entry: ManifestEntry) -> bool:
+    """Check if src matches the existing entry apart from its version, for types where that is allowed."""
+    suffix = src.suffix.lower()
+    if suffix not in _VERSION_INSENSITIVE_SUFFIXES:
+        return False
+
+    handler = registered_types.get(suffix[1:])
+    prospective_entry = handler(src) if handler else None
+    return prospective_entry is not None and entries_match(existing_entry, prospective_entry)
+
+
+def _refresh_entries(by_name: dict[str, ManifestEntry], paths: list[Path]) -> list[ManifestEntry]:
+    """Return the entries updated with freshly built entries for just the given files.
+
+    Files that are missing or no longer produce an entry are dropped.
+    """
+    after_by_name = dict(by_name)
+    for path in paths:
+        entry = create_manifest_entry(path) if path.is_file() else None
+        if entry is None:
+            after_by_name.pop(path.name, None)
+        else:
+            after_by_name[path.name] = entry
+
+    # Keep the same deterministic ordering as a full scan
+    return sorted(after_by_name.values(), key=attrgetter('filename'))
+
+
+def _copy_files(pairs: list[tuple[Path, Path]], *, link: bool) -> None:
+    """Copy (src, dst) pairs using a thread pool so file I/O can overlap.
+
+    Any copy failure is re-raised once all submitted copies have finished.
+    """
+    if not pairs:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(32, len(pairs))) as executor:
+        futures = [executor.submit(_fast_copy, src, dst, allow_link=link) for src, dst in pairs]
+        for future in futures:
+            future.result()
+
+
+def _fast_copy(src: Path, dst: Path, *, allow_link: bool) -> None:
+    """Copy src to dst, or hard-link it when allowed and both are on the same filesystem.
+
+    Linking costs a single syscall regardless of file size. If it fails for any reason
+    (e.g. across filesystems or where links are not permitted) a normal copy is made.
+    """
+    if allow_link:
+        if dst.exists() and dst.samefile(src):
+            return  # already the same file, nothing to do
+
+        try:
+            dst.unlink(missing_ok=True)
+            os.link(src, dst)
+        except OSError:
+            pass  # fall back to copying below
+        else:
+            return
+
+    copy2(src, dst)
+
+
 __all__ = ('apply_import',)
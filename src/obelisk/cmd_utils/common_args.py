@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Annotated
 from rich.logging import RichHandler
 from typer import Exit, Option
 
-from obelisk import __version__
+import obelisk
 from obelisk.rich_console import CustomRichConsole
 
 
@@ -54,7 +54,7 @@ def initialise_app(ctx: Context) -> Console:
 def _handle_version_option(value: str) -> None:
     if not value:
         return
-    print(__version__)
+    print(obelisk.__version__)
     raise Exit(0)
 
 
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import os
+import stat
+from operator import attrgetter
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from obelisk.filtering import file_is_allowed
+from obelisk.filtering import name_is_allowed
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
-    from pathlib import Path
+    from collections.abc import Callable, Iterable
+
+    from typer import Context
 
 
 def _enumerate_input_files(inputs: Iterable[Path]) -> list[Path]:
@@ -18,30 +23,69 @@ def _enumerate_input_files(inputs: Iterable[Path]) -> list[Path]:
     """
     files: list[Path] = []
     for p in inputs:
-        if p.is_file():
+        try:
+            mode = p.stat().st_mode
+        except OSError:
+            continue
+
+        if stat.S_ISREG(mode):
             files.append(p)
-        elif p.is_dir():
-            files.extend([child for child in p.iterdir() if child.is_file()])
+        elif stat.S_ISDIR(mode):
+            # DirEntry caches the file type from the directory listing, so children need no extra stat
+            with os.scandir(p) as it:
+                files.extend(Path(entry.path) for entry in it if entry.is_file())
     return files
 
 
 def collect_allowed_inputs(inputs: Iterable[Path], *, allow_all: bool) -> tuple[list[Path], list[Path]]:
     """Partition inputs into (allowed, filtered) lists.
 
-    Filtering uses ``file_is_allowed`` unless ``allow_all`` is True.
+    Filtering uses the rules of ``name_is_allowed`` unless ``allow_all`` is True.
+    Allowed files are returned in a canonical order, grouped by directory then by name.
+    As all files land in one destination folder, only the last input given for each filename is kept.
     Returns a tuple of (allowed, filtered).
     """
     input_files = _enumerate_input_files(inputs)
     if allow_all:
-        return input_files, []
+        return _dedupe_and_sort(input_files), []
     allowed: list[Path] = []
     filtered: list[Path] = []
     for p in input_files:
-        if file_is_allowed(p):
+        if name_is_allowed(p.name):
             allowed.append(p)
         else:
             filtered.append(p)
-    return allowed, filtered
+    return _dedupe_and_sort(allowed), filtered
+
+
+def collect_inputs_or_exit(
+    inputs: Iterable[Path],
+    *,
+    allow_all: bool,
+    printer: Callable[..., None],
+    ctx: Context,
+) -> list[Path]:
+    """Collect the allowed input files for a command, exiting with an error listing any filtered out."""
+    printer('[bold]Collecting input files...[/bold]')
+    allowed, filtered = collect_allowed_inputs(inputs, allow_all=allow_all)
+    if filtered:
+        printer(
+            '[red]Error:[/red] Some unhandled files are excluded. '
+            'Re-run with [yellow]--allow-all/-a[/yellow] if you are sure you wish to include them:',
+        )
+        for excluded_file in filtered:
+            printer(f'  - {excluded_file}')
+        ctx.exit(1)
+    return allowed
+
+
+def _dedupe_and_sort(files: list[Path]) -> list[Path]:
+    # Keeping files from the same directory together also keeps their lookups warm in the dentry cache
+    by_name = {p.name: p for p in files}
+    return sorted(by_name.values(), key=attrgetter('parent', 'name'))
 
 
-__all__ = ('collect_allowed_inputs',)
+__all__ = (
+    'collect_allowed_inputs',
+    'collect_inputs_or_exit',
+)
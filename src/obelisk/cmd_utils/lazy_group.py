@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any, ClassVar, override
+
+import typer.main
+from typer.core import TyperGroup
+
+
+class LazyCommandGroup(TyperGroup):
+    """A command group that imports each subcommand's module only when that subcommand is needed.
+
+    Subclasses map command names to the modules holding their single-command Typer ``app``.
+    """
+
+    lazy_commands: ClassVar[dict[str, str]] = {}
+
+    @override
+    def list_commands(self, ctx: Any) -> list[str]:
+        return [*super().list_commands(ctx), *self.lazy_commands]
+
+    @override
+    def get_command(self, ctx: Any, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            app: typer.Typer = importlib.import_module(self.lazy_commands[cmd_name]).app
+            # Build the command as add_typer would, so it inherits this group's settings
+            command = typer.main.get_command_from_info(
+                app.registered_commands[0],
+                pretty_exceptions_short=app.pretty_exceptions_short,
+                rich_markup_mode=self.rich_markup_mode,
+            )
+            self.add_command(command, cmd_name)
+        return command
+
+
+__all__ = ('LazyCommandGroup',)
@@ -8,8 +8,9 @@ from typer import Argument, Context, Option, Typer
 
 from obelisk.cmd_utils.apply_import import apply_import
 from obelisk.cmd_utils.common_args import DRY_RUN_ARG, QUIET_ARG, VERBOSE_ARG, VERSION_ARG, initialise_app
-from obelisk.cmd_utils.input_utils import collect_allowed_inputs
+from obelisk.cmd_utils.input_utils import collect_inputs_or_exit
 from obelisk.manifest import manifest_match
+from obelisk.scanner import ScanCache
 
 
 if TYPE_CHECKING:
@@ -62,6 +63,37 @@ def add_files(
             help='Allow importing files normally filtered out (hidden/underscored or unrecognised types).',
         ),
     ] = False,
+    link: Annotated[
+        bool,
+        Option(
+            '--link',
+            help=(
+                'Hard-link files into the destination instead of copying when on the same filesystem. '
+                'Linked files share content with their source, so later edits to either affect both.'
+            ),
+        ),
+    ] = False,
+    trust_manifest: Annotated[
+        bool,
+        Option(
+            '--trust-manifest',
+            help=(
+                'Take the existing manifest as the current state of the destination instead of rescanning it. '
+                'Only files being replaced are re-read, which is much faster for large folders.'
+            ),
+        ),
+    ] = False,
+    stat_cache: Annotated[
+        Path | None,
+        Option(
+            '--stat-cache',
+            help=(
+                'Remember file sizes, timestamps and hashes in this file between runs, '
+                'so unchanged files are not re-hashed. Keep it outside the data folder.'
+            ),
+            dir_okay=False,
+        ),
+    ] = None,
     show_version: VERSION_ARG = False,
     dry_run: DRY_RUN_ARG = False,
     verbose: VERBOSE_ARG = False,
@@ -78,19 +110,21 @@ def add_files(
     dest_path = _resolve_dest_folder(dest, printer=print, ctx=ctx)
 
     # Collect and filter inputs
-    print('[bold]Collecting input files...[/bold]')
-    allowed, filtered = collect_allowed_inputs(inputs, allow_all=allow_all)
-    if filtered:
-        print(
-            '[red]Error:[/red] Some unhandled files are excluded. '
-            'Re-run with [yellow]--allow-all/-a[/yellow] if you are sure you wish to include them:',
-        )
-        for excluded_file in filtered:
-            print(f'  - {excluded_file}')
-        ctx.exit(1)
+    allowed = collect_inputs_or_exit(inputs, allow_all=allow_all, printer=print, ctx=ctx)
 
     # Perform copy and manifest update
-    before_entries, after_entries = apply_import(dest_path, allowed, dry_run=dry_run, printer=print)
+    scan_cache = ScanCache.load(stat_cache) if stat_cache else None
+    before_entries, after_entries = apply_import(
+        dest_path,
+        allowed,
+        dry_run=dry_run,
+        printer=print,
+        link_when_possible=link,
+        trust_manifest=trust_manifest,
+        scan_cache=scan_cache,
+    )
+    if scan_cache and stat_cache and not dry_run:
+        scan_cache.save(stat_cache)
 
     if manifest_match(before_entries, after_entries):
         print('[green]No manifest changes needed.[/green]')
@@ -102,7 +136,8 @@ def add_files(
 def _resolve_dest_folder(dest: Path, *, printer: Callable[..., None], ctx: Context) -> Path:
     # Accept absolute or relative; if path exists and is a file, bail.
     dest_path = Path(dest).resolve()
-    if dest_path.exists() and not dest_path.is_dir():
+    # Check is_dir first so the common case (an existing folder) needs a single stat
+    if not dest_path.is_dir() and dest_path.exists():
         printer('[red]Error:[/red] Destination path exists and is not a directory')
         ctx.exit(1)
     return dest_path
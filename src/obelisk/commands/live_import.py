@@ -8,10 +8,11 @@ from typer import Argument, Context, Option, Typer
 
 from obelisk.cmd_utils.apply_import import apply_import
 from obelisk.cmd_utils.common_args import DRY_RUN_ARG, QUIET_ARG, VERBOSE_ARG, VERSION_ARG, initialise_app
-from obelisk.cmd_utils.input_utils import collect_allowed_inputs
+from obelisk.cmd_utils.input_utils import collect_inputs_or_exit
 from obelisk.commits import build_commit_message
 from obelisk.git import commit_all, fast_forward, fetch, is_clean, is_git_available, push, reset_hard
 from obelisk.manifest import manifest_match
+from obelisk.scanner import ScanCache
 
 
 if TYPE_CHECKING:
@@ -121,6 +122,27 @@ def live_import(
             help='Skip pushing changes to the remote repository.',
         ),
     ] = False,
+    trust_manifest: Annotated[
+        bool,
+        Option(
+            '--trust-manifest',
+            help=(
+                'Take the existing manifest as the current state of the destination instead of rescanning it. '
+                'Only files being replaced are re-read, which is much faster for large folders.'
+            ),
+        ),
+    ] = False,
+    stat_cache: Annotated[
+        Path | None,
+        Option(
+            '--stat-cache',
+            help=(
+                'Remember file sizes, timestamps and hashes in this file between runs, '
+                'so unchanged files are not re-hashed. Keep it outside the data folder.'
+            ),
+            dir_okay=False,
+        ),
+    ] = None,
     show_version: VERSION_ARG = False,
     dry_run: DRY_RUN_ARG = False,
     verbose: VERBOSE_ARG = False,
@@ -145,10 +167,20 @@ def live_import(
     _sync_repository(repo, dry_run=dry_run, skip_pull=skip_pull, git_reset=git_reset, printer=print, ctx=ctx)
 
     # Collect and filter inputs
-    allowed = _collect_input_files(inputs, allow_all=allow_all, printer=print, ctx=ctx)
+    allowed = collect_inputs_or_exit(inputs, allow_all=allow_all, printer=print, ctx=ctx)
 
     # Ensure destination exists and perform copy + manifest update
-    before_entries, after_entries = apply_import(dest_path, allowed, dry_run=dry_run, printer=print)
+    scan_cache = ScanCache.load(stat_cache) if stat_cache else None
+    before_entries, after_entries = apply_import(
+        dest_path,
+        allowed,
+        dry_run=dry_run,
+        printer=print,
+        trust_manifest=trust_manifest,
+        scan_cache=scan_cache,
+    )
+    if scan_cache and stat_cache and not dry_run:
+        scan_cache.save(stat_cache)
 
     # Compute commit message and decide whether to commit
     if manifest_match(before_entries, after_entries):
@@ -207,7 +239,8 @@ def _validate_relative_dest_path(repo: Path, dest: str, *, printer: Callable[...
         printer('[red]Error:[/red] Destination path must be within the repository')
         ctx.exit(1)
 
-    if not resolved.exists() or not resolved.is_dir():
+    # is_dir() is False for missing paths too, so one stat covers both checks
+    if not resolved.is_dir():
         printer('[red]Error:[/red] Destination path must be an existing directory')
         ctx.exit(1)
 
@@ -263,26 +296,6 @@ def _sync_repository(
         ctx.exit(1)
 
 
-def _collect_input_files(
-    inputs: list[Path],
-    *,
-    allow_all: bool,
-    printer: Callable[..., None],
-    ctx: Context,
-) -> list[Path]:
-    printer('[bold]Collecting input files...[/bold]')
-    allowed, filtered = collect_allowed_inputs(inputs, allow_all=allow_all)
-    if filtered:
-        printer(
-            '[red]Error:[/red] Some unhandled files are excluded. '
-            'Re-run with [yellow]--allow-all/-a[/yellow] if you are sure you wish to include them:',
-        )
-        for excluded_file in filtered:
-            printer(f'  - {excluded_file}')
-        ctx.exit(1)
-    return allowed
-
-
 def _maybe_push(
     repo: Path,
     *,
@@ -4,11 +4,11 @@ import logging
 from pathlib import Path  # noqa: TC003 - just plain wrong
 from typing import Annotated
 
-from typer import Argument, Context, Typer
+from typer import Argument, Context, Option, Typer
 
 from obelisk.cmd_utils.common_args import DRY_RUN_ARG, QUIET_ARG, VERBOSE_ARG, VERSION_ARG, initialise_app
 from obelisk.manifest import manifest_match, parse_manifest, write_manifest
-from obelisk.scanner import create_manifest_from_folder
+from obelisk.scanner import ScanCache, create_manifest_from_folder
 
 
 logger = logging.getLogger('obelisk')
@@ -33,6 +33,17 @@ def update_manifest(
             metavar='MANIFEST',
         ),
     ],
+    stat_cache: Annotated[
+        Path | None,
+        Option(
+            '--stat-cache',
+            help=(
+                'Remember file sizes, timestamps and hashes in this file between runs, '
+                'so unchanged files are not re-hashed. Keep it outside the data folder.'
+            ),
+            dir_okay=False,
+        ),
+    ] = None,
     show_version: VERSION_ARG = False,
     dry_run: DRY_RUN_ARG = False,
     verbose: VERBOSE_ARG = False,
@@ -51,44 +62,61 @@ def update_manifest(
 
     print(f'[bold]Folder:[/bold] {folder_path}')
 
+    # Nothing in the folder has changed since its manifest was last confirmed, so skip parsing and scanning
+    scan_cache = ScanCache.load(stat_cache) if stat_cache else None
+    if scan_cache and scan_cache.folder_unchanged(folder_path):
+        print('[bold green]:thumbs_up: No updates necessary to the manifest.[/bold green]')
+        return
+
     # Parse the existing manifest if it exists
     existing_manifest = None
     if manifest_path.exists():
         existing_manifest = parse_manifest(manifest_path)
 
     # Scan the folder and create a fresh manifest
-    new_manifest = create_manifest_from_folder(folder_path)
+    new_manifest = create_manifest_from_folder(folder_path, scan_cache=scan_cache)
+
+    def remember_unchanged() -> None:
+        if scan_cache:
+            scan_cache.mark_folder_checked(folder_path)
+
+    try:
+        # Handle empty manifests: delete existing file or no-op if none exists
+        if not new_manifest:
+            had_manifest = manifest_path.exists()
+            if not had_manifest:
+                remember_unchanged()
+                print('[bold green]:thumbs_up: No updates necessary to the manifest.[/bold green]')
+                return
+
+            print('[bold green]Changes detected in the manifest.[/bold green]')
+            if dry_run:
+                print('[bold yellow]No valid entries found; would delete existing manifest.[/bold yellow]')
+                print('[bold yellow]:no_entry: Dry run mode - no changes will be written.[/bold yellow]')
+                ctx.exit(2)
+
+            manifest_path.unlink()
+            print(f'[bold green]Manifest removed at {manifest_path} (no entries)[/bold green]')
+            return
 
-    # Handle empty manifests: delete existing file or no-op if none exists
-    if not new_manifest:
-        had_manifest = manifest_path.exists()
-        if not had_manifest:
+        # Compare and update the manifest as needed for non-empty manifests
+        if existing_manifest and manifest_match(existing_manifest, new_manifest):
+            remember_unchanged()
             print('[bold green]:thumbs_up: No updates necessary to the manifest.[/bold green]')
             return
 
         print('[bold green]Changes detected in the manifest.[/bold green]')
         if dry_run:
-            print('[bold yellow]No valid entries found; would delete existing manifest.[/bold yellow]')
             print('[bold yellow]:no_entry: Dry run mode - no changes will be written.[/bold yellow]')
+            # Give a return code indicating changes would be made
             ctx.exit(2)
 
-        manifest_path.unlink()
-        print(f'[bold green]Manifest removed at {manifest_path} (no entries)[/bold green]')
-        return
-
-    # Compare and update the manifest as needed for non-empty manifests
-    if existing_manifest and manifest_match(existing_manifest, new_manifest):
-        print('[bold green]:thumbs_up: No updates necessary to the manifest.[/bold green]')
-        return
-
-    print('[bold green]Changes detected in the manifest.[/bold green]')
-    if dry_run:
-        print('[bold yellow]:no_entry: Dry run mode - no changes will be written.[/bold yellow]')
-        # Give a return code indicating changes would be made
-        ctx.exit(2)
-
-    write_manifest(manifest_path, new_manifest)
-    print(f'[bold green]Manifest updated at {manifest_path}[/bold green]')
+        write_manifest(manifest_path, new_manifest)
+        print(f'[bold green]Manifest updated at {manifest_path}[/bold green]')
+    finally:
+        # Saved once whichever way the command finishes, including any folder confirmed unchanged above
+        if scan_cache and stat_cache and not dry_run:
+            scan_cache.save(stat_cache)
 
 
 __all__ = ('app',)
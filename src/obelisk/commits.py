@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
+from collections import ChainMap
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from string import Template
 from typing import TYPE_CHECKING, Any
 
-from natsort import natsorted, ns
+from natsort import natsort_keygen, ns
 
 from .manifest import ManifestEntry
 
@@ -16,6 +19,10 @@ if TYPE_CHECKING:  # type-only imports
     from collections.abc import Iterable
 
 
+# Built once rather than on every natsorted call, and memoised as the same filenames recur across sorts
+_natural_key = lru_cache(maxsize=1 << 16)(natsort_keygen(alg=ns.IGNORECASE))
+
+
 @dataclass(frozen=True)
 class _ChangeSets:
     added: list[ManifestEntry]
@@ -32,31 +39,43 @@ def _diff_entries(
     Returns a tuple of added entries, removed entries, and updated pairs.
     Entries are matched by filename.
 
-    Input lists are assumed to already be sorted for deterministic output.
+    Inputs are normally already sorted by filename (as produced by the scanner), which makes the sort
+    here a single linear check before both sides are walked together in one pass.
     """
-    before_map = {e.filename: e for e in before}
-    after_map = {e.filename: e for e in after}
+    by_filename = attrgetter('filename')
+    before_list = sorted(before, key=by_filename)
+    after_list = sorted(after, key=by_filename)
 
     added: list[ManifestEntry] = []
     removed: list[ManifestEntry] = []
     updated: list[tuple[ManifestEntry, ManifestEntry]] = []
 
-    # Detect additions and updates
-    for fname, a_entry in after_map.items():
-        b_entry = before_map.get(fname)
-        if b_entry is None:
+    i = j = 0
+    while i < len(before_list) and j < len(after_list):
+        b_entry, a_entry = before_list[i], after_list[j]
+        if b_entry.filename < a_entry.filename:
+            removed.append(b_entry)
+            i += 1
+        elif b_entry.filename > a_entry.filename:
             added.append(a_entry)
-        elif b_entry != a_entry:
-            updated.append((b_entry, a_entry))
+            j += 1
+        else:
+            if b_entry != a_entry:
+                updated.append((b_entry, a_entry))
+            i += 1
+            j += 1
 
-    # Detect removals
-    for fname, b_entry in before_map.items():
-        if fname not in after_map:
-            removed.append(b_entry)
+    # Whatever is left on either side has no counterpart
+    removed.extend(before_list[i:])
+    added.extend(after_list[j:])
 
     return _ChangeSets(added=added, removed=removed, updated=updated)
 
 
+def _filename_key(entry: ManifestEntry) -> Any:
+    return _natural_key(entry.filename)
+
+
 def _fmt_version(v: str | None) -> str:
     return f'v{v}' if v else 'no version'
 
@@ -70,31 +89,34 @@ def build_file_change_list(before: list[ManifestEntry], after: list[ManifestEntr
 
     Output will be sorted by filename order using natural language sorting.
     """
-    changes = _diff_entries(before, after)
+    return _format_change_list(_diff_entries(before, after))
+
 
+def _format_change_list(changes: _ChangeSets) -> str:
     sections: list[list[str]] = []
 
+    # Entries are sorted by their bare filenames, then formatted, so the sort key never sees the decoration
     if changes.added:
         added_lines = [
             f'* {e.filename} ({_fmt_version(e.version)})' if e.version else f'* {e.filename}'
-            for e in changes.added
+            for e in sorted(changes.added, key=_filename_key)
         ]
-        sections.append(['Added:', *natsorted(added_lines, alg=ns.IGNORECASE)])
+        sections.append(['Added:', *added_lines])
 
     if changes.updated:
         updated_lines: list[str] = []
-        for b, a in changes.updated:
+        for b, a in sorted(changes.updated, key=lambda pair: _filename_key(pair[1])):
             b_ver, a_ver = b.version, a.version
             if b_ver != a_ver:
                 updated_lines.append(f'* {a.filename} ({_fmt_version(a_ver)})')
             else:
                 # Either both None or equal versions; something else changed (hash, mod, format)
                 updated_lines.append(f'* {a.filename}')
-        sections.append(['Updated:', *natsorted(updated_lines, alg=ns.IGNORECASE)])
+        sections.append(['Updated:', *updated_lines])
 
     if changes.removed:
-        removed_lines = [f'* {e.filename}' for e in changes.removed]
-        sections.append(['Removed:', *natsorted(removed_lines, alg=ns.IGNORECASE)])
+        removed_lines = [f'* {e.filename}' for e in sorted(changes.removed, key=_filename_key)]
+        sections.append(['Removed:', *removed_lines])
 
     return '\n\n'.join('\n'.join(block) for block in sections)
 
@@ -125,11 +147,11 @@ def build_commit_message(  # noqa: PLR0913 - appropriate for the use
     upd_n = len(changes.updated)
     rem_n = len(changes.removed)
 
-    template_fields = dict(template_fields or {})  # make a copy
-    template_fields['added'] = add_n
-    template_fields['updated'] = upd_n
-    template_fields['removed'] = rem_n
-    template_fields['total'] = add_n + upd_n + rem_n
+    # Layer the counts over the caller's fields without copying or mutating them
+    fields = ChainMap(
+        {'added': add_n, 'updated': upd_n, 'removed': rem_n, 'total': add_n + upd_n + rem_n},
+        template_fields or {},
+    )
 
     if not title:
         if add_n == upd_n == rem_n == 0:
@@ -139,16 +161,17 @@ def build_commit_message(  # noqa: PLR0913 - appropriate for the use
     else:
         title = title.strip()
 
-    title = Template(title).substitute(template_fields)
+    title = Template(title).substitute(fields)
 
     parts: list[str] = [title]
 
     if add_body:
-        body = Template(add_body).substitute(template_fields)
+        body = Template(add_body).substitute(fields)
         parts.extend(['', body.strip()])
 
     if include_file_list:
-        change_list = build_file_change_list(before, after)
+        # Reuse the diff computed above rather than diffing the manifests a second time
+        change_list = _format_change_list(changes)
         if change_list:
             parts.extend(['', change_list])
 
@@ -17,11 +17,10 @@ registered_types: dict[str, MetadataReader] = {
     'jpeg': get_metadata_from_binary,
 }
 
-allowed_types = set(registered_types.keys())
-version_only_change_insensitive_types = {'json', 'jsonc'}
+version_only_change_insensitive_types = frozenset({'json', 'jsonc'})
 
 __all__ = (
-    'allowed_types',
+    'MetadataReader',
     'registered_types',
     'version_only_change_insensitive_types',
 )
@@ -9,6 +9,9 @@ from obelisk.manifest import ManifestEntry
 
 logger = logging.getLogger(__name__)
 
+# Characters of normalized JSON encoded per hasher update, bounding the extra memory needed for hashing
+_HASH_CHUNK_CHARS = 1 << 16
+
 
 def _only_string(value: Any) -> str | None:
     if isinstance(value, str):
@@ -23,12 +26,13 @@ def _only_dict(value: Any) -> dict[str, Any] | None:
 
 
 def _load_json(file_path: Path) -> Any | None:
-    with file_path.open('r', encoding='utf-8') as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError:
-            logger.warning('Failed to decode JSON from %s', file_path)
-            return None
+    # Read raw bytes in one go and let the parser decode them, rather than streaming through a text wrapper
+    raw = file_path.read_bytes()
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        logger.warning('Failed to decode JSON from %s', file_path)
+        return None
 
 
 def _hash_json_content(data: dict[str, Any]) -> str:
@@ -41,8 +45,12 @@ def _hash_json_content(data: dict[str, Any]) -> str:
     # Exclude top-level version from the hash to allow version-only tolerance
     filtered = {k: v for k, v in data.items() if k != 'version'}
     normalized = json.dumps(filtered, separators=(',', ':'), ensure_ascii=False)
-    digest = hashlib.md5(normalized.encode('utf-8')).hexdigest()  # noqa: S324 - not for security
-    return f'md5json:{digest}:{len(normalized)}'
+
+    # Encode and hash in slices rather than materialising a second, byte copy of the whole document
+    hasher = hashlib.md5(usedforsecurity=False)
+    for start in range(0, len(normalized), _HASH_CHUNK_CHARS):
+        hasher.update(normalized[start : start + _HASH_CHUNK_CHARS].encode('utf-8'))
+    return f'md5json:{hasher.hexdigest()}:{len(normalized)}'
 
 
 def get_metadata_from_json(file_path: Path) -> ManifestEntry | None:
@@ -1,22 +1,24 @@
-from pathlib import Path
+from obelisk.filetypes import MetadataReader, registered_types
 
-from obelisk.filetypes import allowed_types
 
-
-def file_is_allowed(file: Path) -> bool:
+def name_is_allowed(filename: str) -> bool:
     """
-    Check if a file should be allowed in a manifest.
-    Directories are disallowed.
+    Check if a file should be allowed in a manifest, from its bare filename alone.
     Files beginning with '.' and '_' are disallowed.
-    Files with extensions not in allowed_types are disallowed.
+    Files with extensions without a registered handler are disallowed.
+    Callers must check separately that the path is a file.
     """
-    if file.is_dir():
-        return False
-
-    if file.name.startswith(('.', '_')):
-        return False
+    return reader_for_name(filename) is not None
 
-    if file.suffix.lstrip('.') not in allowed_types:  # noqa: SIM103 - better readability
-        return False
 
-    return True
+def reader_for_name(filename: str) -> MetadataReader | None:
+    """
+    Find the metadata reader for a bare filename, or None if the rules of name_is_allowed reject it.
+    This combines the filtering and the handler lookup into a single step for scanners.
+    """
+    # Look the extension up first: most rejected names in a data folder fail on that alone
+    _, dot, ext = filename.rpartition('.')
+    reader = registered_types.get(ext)
+    if reader is None or not dot or filename.startswith(('.', '_')):
+        return None
+    return reader
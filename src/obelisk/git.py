@@ -3,6 +3,7 @@ from __future__ import annotations
 import shutil
 import logging
 import subprocess
+from functools import cache
 from typing import TYPE_CHECKING
 
 
@@ -13,9 +14,15 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+@cache
+def _which_git() -> str | None:
+    # Searching PATH stats every candidate, so do it once per process rather than for every git command
+    return shutil.which('git')
+
+
 def is_git_available() -> bool:
     """Return True if the Git CLI is available on PATH."""
-    return shutil.which('git') is not None
+    return _which_git() is not None
 
 
 def _format_cmd(args: Iterable[str]) -> str:
@@ -23,7 +30,7 @@ def _format_cmd(args: Iterable[str]) -> str:
 
 
 def _git_executable() -> str:
-    exe = shutil.which('git')
+    exe = _which_git()
     if not exe:
         raise FileNotFoundError('git executable not found on PATH')
     return exe
@@ -1,6 +1,12 @@
 import json
+from collections.abc import Iterator
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
+
+
+# Large enough that most manifests reach the disk in a single write call
+_WRITE_BUFFER_SIZE = 1 << 17
 
 
 def save_as_json(path: Path, data: Any) -> None:
@@ -9,9 +15,8 @@ def save_as_json(path: Path, data: Any) -> None:
     This uses a customised formatting to shrink mod dicts to single lines where possible.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open('wt', encoding='utf-8', newline='\n') as f:
-        content = pretty_json(data, indent='\t', max_line=120, sort_keys=False, expand_top_level=True)
-        f.write(content)
+    with path.open('wt', buffering=_WRITE_BUFFER_SIZE, encoding='utf-8', newline='\n') as f:
+        f.writelines(iter_pretty_json(data, indent='\t', max_line=120, sort_keys=False, expand_top_level=True))
 
 
 JsonType = dict[str, Any] | list[Any] | str | int | float | bool | None
@@ -33,6 +38,32 @@ def pretty_json(  # noqa: PLR0913 - acceptable
     - Supports sort_keys and indent as int or str
     - Optional top-level control via expand_top_level
     """
+    return ''.join(
+        iter_pretty_json(
+            obj,
+            indent=indent,
+            max_line=max_line,
+            sort_keys=sort_keys,
+            expand_top_level=expand_top_level,
+            level=level,
+        ),
+    )
+
+
+def iter_pretty_json(  # noqa: PLR0913 - mirrors pretty_json
+    obj: JsonType,
+    *,
+    indent: int | str = 4,
+    max_line: int = 100,
+    sort_keys: bool = False,
+    expand_top_level: bool = False,
+    level: int = 0,
+) -> Iterator[str]:
+    """
+    Produce the same output as pretty_json, as a sequence of string pieces.
+    Wrapped containers are emitted piece by piece, so large documents can be written out without
+    first being built up as one string.
+    """
     # Normalize indent
     if isinstance(indent, int):
         indent_str = ' ' * indent
@@ -41,34 +72,128 @@ def pretty_json(  # noqa: PLR0913 - acceptable
     else:
         raise TypeError('indent must be int or str')
 
+    return _emit(
+        obj,
+        indent_str=indent_str,
+        max_line=max_line,
+        sort_keys=sort_keys,
+        expand=expand_top_level,
+        level=level,
+    )
+
+
+def _emit(  # noqa: PLR0913 - internal recursion state
+    obj: Any,
+    *,
+    indent_str: str,
+    max_line: int,
+    sort_keys: bool,
+    expand: bool,
+    level: int,
+) -> Iterator[str]:
+    if not isinstance(obj, dict | list):
+        yield _dump_scalar(obj)
+        return
+
     sp = indent_str * level
 
+    # Collapse onto one line if it fits - decided in a single pass that gives up as soon as the line is too long
+    if not expand:
+        one_line = _one_line(
+            obj,
+            sort_keys=sort_keys,
+            budget=max_line - len(sp),
+            max_line=max_line,
+            indent_width=len(indent_str),
+            level=level,
+        )
+        if one_line is not None:
+            yield one_line
+            return
+
+    children: Iterator[tuple[str, Any]]
     if isinstance(obj, dict):
-        items: list[str] = []
-        keys = sorted(obj.keys()) if sort_keys else list(obj.keys())
-        for key in keys:
-            value = obj[key]
-            content = pretty_json(value, indent=indent, max_line=max_line, sort_keys=sort_keys, level=level + 1)
-            items.append(f'{json.dumps(key)}: {content}')
-        one_line = '{ ' + ', '.join(items) + ' }'
-        if not expand_top_level and len(one_line) + len(sp) <= max_line:
-            return one_line
-        return '{\n' + ',\n'.join(sp + indent_str + item for item in items) + '\n' + sp + '}'
-
-    if isinstance(obj, list):
-        items = [
-            pretty_json(value, indent=indent, max_line=max_line, sort_keys=sort_keys, level=level + 1)
-            for value in obj
-        ]
-        one_line = '[ ' + ', '.join(items) + ' ]'
-        if not expand_top_level and len(one_line) + len(sp) <= max_line:
-            return one_line
-        return '[\n' + ',\n'.join(sp + indent_str + item for item in items) + '\n' + sp + ']'
+        open_char, close_char = '{', '}'
+        obj_dict = cast('dict[Any, Any]', obj)
+        keys = sorted(obj_dict) if sort_keys else list(obj_dict)
+        children = ((f'{_dump_scalar(key)}: ', obj_dict[key]) for key in keys)
+    else:
+        open_char, close_char = '[', ']'
+        children = (('', value) for value in cast('list[Any]', obj))
+
+    yield open_char + '\n'
+    item_sp = sp + indent_str
+    for i, (prefix, value) in enumerate(children):
+        if i:
+            yield ',\n'
+        yield item_sp + prefix
+        yield from _emit(
+            value,
+            indent_str=indent_str,
+            max_line=max_line,
+            sort_keys=sort_keys,
+            expand=False,
+            level=level + 1,
+        )
+    yield '\n' + sp + close_char
+
+
+def _one_line(  # noqa: PLR0913 - internal recursion state
+    obj: Any,
+    *,
+    sort_keys: bool,
+    budget: int,
+    max_line: int,
+    indent_width: int,
+    level: int,
+) -> str | None:
+    """Render obj on a single line, or return None as soon as it is known to exceed budget characters.
+
+    Each child must also fit on a line of its own at its nesting level, as it would have to if wrapped.
+    """
+    if isinstance(obj, dict):
+        obj_dict = cast('dict[Any, Any]', obj)
+        keys = sorted(obj_dict) if sort_keys else list(obj_dict)
+        pairs = ((f'{_dump_scalar(key)}: ', obj_dict[key]) for key in keys)
+        open_char, close_char = '{ ', ' }'
+    elif isinstance(obj, list):
+        pairs = (('', value) for value in cast('list[Any]', obj))
+        open_char, close_char = '[ ', ' ]'
+    else:
+        return _dump_scalar(obj)
+
+    items: list[str] = []
+    used = 2  # the brackets and padding (4), less the separator counted for the first item
+    child_line = max_line - indent_width * (level + 1)
+    for prefix, value in pairs:
+        content = _one_line(
+            value,
+            sort_keys=sort_keys,
+            budget=min(budget - used - len(prefix) - 2, child_line),
+            max_line=max_line,
+            indent_width=indent_width,
+            level=level + 1,
+        )
+        if content is None:
+            return None
+        used += len(prefix) + len(content) + 2
+        if used > budget:
+            return None
+        items.append(prefix + content)
+
+    one_line = open_char + ', '.join(items) + close_char
+    return one_line if len(one_line) <= budget else None
+
 
+def _dump_scalar(obj: Any) -> str:
+    # Strings dominate manifests, so encode them directly rather than going through json.dumps each time
+    if type(obj) is str:
+        return encode_basestring_ascii(obj)
     return json.dumps(obj)
 
 
 __all__ = (
+    'iter_pretty_json',
     'pretty_json',
     'save_as_json',
 )
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from collections import Counter
+from dataclasses import dataclass
 from operator import attrgetter
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
 
-from pydantic import BaseModel
+from pydantic import TypeAdapter, ValidationError
 
 from obelisk.json_utils import save_as_json
 
@@ -16,21 +17,27 @@ if TYPE_CHECKING:
 MANIFEST_FILENAME = '_manifest.json'
 
 
-class ManifestFile(BaseModel):
-    version: str | None = None
-    format: str | None = None
+class RawManifestEntry(TypedDict, total=False):
+    version: str | None
+    hash: str | None
+    format: str | None
+    mod: dict[str, Any] | None
+    metadata: dict[str, Any] | None
+
+
+class ManifestFile(TypedDict):
+    version: NotRequired[str | None]
+    format: NotRequired[str | None]
     files: dict[str, RawManifestEntry]
 
 
-class RawManifestEntry(BaseModel):
-    version: str | None = None
-    hash: str | None = None
-    format: str | None = None
-    mod: dict[str, Any] | None = None
-    metadata: dict[str, Any] | None = None
+# Validating into plain dicts is much quicker than building a model instance for every entry
+_manifest_file_adapter = TypeAdapter(ManifestFile)
 
 
-class ManifestEntry(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ManifestEntry:
+    # Plain slotted dataclass: these are created and compared in bulk, and only built from already-checked data
     filename: str
     version: str | None = None
     hash: str | None = None
@@ -52,55 +59,64 @@ def parse_manifest(path: Path) -> list[ManifestEntry]:
         }
       }
     """
-    data = path.read_text(encoding='utf-8')
-    full_manifest = ManifestFile.model_validate_json(data, strict=True)
+    # Sort entries by filename for consistency (linear for manifests we wrote, as those are already in order)
+    return sorted(parse_manifest_by_name(path).values(), key=attrgetter('filename'))
+
+
+def parse_manifest_by_name(path: Path) -> dict[str, ManifestEntry]:
+    """Load a manifest as parse_manifest does, keyed by filename in the order they appear in the file."""
+    # pydantic-core parses and validates UTF-8 bytes directly, so skip decoding to str first
+    data = path.read_bytes()
+    full_manifest = _manifest_file_adapter.validate_json(data, strict=True)
 
     # Propagate top-level format to entries where missing
-    global_format = full_manifest.format
-    entries: list[ManifestEntry] = []
-    for filename, entry in full_manifest.files.items():
-        new_entry = ManifestEntry.model_validate(
-            {
-                **entry.model_dump(),
-                'filename': filename,
-                'format': entry.format or global_format,
-            },
-            strict=True,
+    global_format = full_manifest.get('format')
+    return {
+        filename: ManifestEntry(
+            filename=filename,
+            version=entry.get('version'),
+            hash=entry.get('hash'),
+            format=entry.get('format') or global_format,
+            mod=entry.get('mod'),
+            metadata=entry.get('metadata'),
         )
-        entries.append(new_entry)
+        for filename, entry in full_manifest['files'].items()
+    }
 
-    # Sort entries by filename for consistency
-    entries.sort(key=attrgetter('filename'))
 
-    return entries
+def read_manifest(path: Path) -> list[ManifestEntry] | None:
+    """Load a manifest as parse_manifest does, returning None if it is missing or invalid."""
+    try:
+        return parse_manifest(path)
+    except (FileNotFoundError, ValidationError):
+        return None
 
 
 def write_manifest(path: Path, entries: list[ManifestEntry]) -> None:
     """Write a manifest to the specified path."""
 
-    # First, look for the most common format among entries
-    format_counts: Counter[str] = Counter(entry.format for entry in entries if entry.format)
-    most_common: list[tuple[str, int]] = format_counts.most_common(1)
-    global_format = most_common[0][0] if most_common else None
-
-    # Build the output file
-    file_data = ManifestFile(
-        format=global_format,
-        files={},
-    )
-    for entry in entries:
-        raw_entry = RawManifestEntry(
-            version=entry.version,
-            hash=entry.hash,
-            mod=entry.mod,
-            metadata=entry.metadata,
-        )
-        if entry.format != global_format:
-            raw_entry.format = entry.format
-        file_data.files[entry.filename] = raw_entry
-
-    # Get the raw data
-    data = file_data.model_dump(exclude_none=True)
+    # First, look for the most common format among entries (counted without a Python-level loop)
+    format_counts: Counter[str] = Counter(filter(None, map(attrgetter('format'), entries)))
+    global_format = max(format_counts, key=format_counts.__getitem__, default=None)
+
+    # Build the output file in a single pass, only setting fields that have a value (in output key order)
+    # Files are always written in filename order, so the file diffs cleanly and reads back without reordering
+    files: dict[str, RawManifestEntry] = {}
+    for entry in sorted(entries, key=attrgetter('filename')):
+        raw_entry: RawManifestEntry = {}
+        if entry.version is not None:
+            raw_entry['version'] = entry.version
+        if entry.hash is not None:
+            raw_entry['hash'] = entry.hash
+        if entry.format is not None and entry.format != global_format:
+            raw_entry['format'] = entry.format
+        if entry.mod is not None:
+            raw_entry['mod'] = entry.mod
+        if entry.metadata is not None:
+            raw_entry['metadata'] = entry.metadata
+        files[entry.filename] = raw_entry
+
+    data: ManifestFile = {'format': global_format, 'files': files} if global_format else {'files': files}
 
     # Write to file using our slightly customised JSON serialiser
     save_as_json(path, data)
@@ -114,7 +130,8 @@ def manifest_match(a: list[ManifestEntry], b: list[ManifestEntry]) -> bool:
     if len(a) != len(b):
         return False
 
-    return all(entries_match(entry_a, entry_b) for entry_a, entry_b in zip(a, b, strict=True))
+    # map pairs the lists up in C, with no generator frame or tuple per entry; lengths are already known equal
+    return all(map(entries_match, a, b))
 
 
 def entries_match(a: ManifestEntry, b: ManifestEntry) -> bool:
@@ -123,6 +140,9 @@ def entries_match(a: ManifestEntry, b: ManifestEntry) -> bool:
     Version-only differences are ignored so JSON files that only bump their
     version do not trigger changes. All other fields must match.
     """
+    # Unchanged entries are often carried over as the same object
+    if a is b:
+        return True
 
     json_hash_matches = True
     if a.json_hash is not None and b.json_hash is not None:
@@ -144,5 +164,7 @@ __all__ = (
     'entries_match',
     'manifest_match',
     'parse_manifest',
+    'parse_manifest_by_name',
+    'read_manifest',
     'write_manifest',
 )
@@ -5,6 +5,10 @@ from rich.console import Console
 from rich.segment import Segment
 
 
+# Built once rather than on every log call
+_split_and_crop_lines_unpadded = functools.partial(Segment.split_and_crop_lines, pad=False)
+
+
 class CustomRichConsole(Console):
     def log(self, *args, **kwargs) -> None:  # type: ignore
         # Backup existing before override
@@ -13,10 +17,7 @@ class CustomRichConsole(Console):
 
         try:
             # Override for custom behavior
-            Segment.split_and_crop_lines = functools.partial(
-                Segment.split_and_crop_lines,
-                pad=False,
-            )  # type: ignore
+            Segment.split_and_crop_lines = _split_and_crop_lines_unpadded  # type: ignore
             self.width = sys.maxsize
 
             result = super().log(*args, **kwargs)  # type: ignore
@@ -1,29 +1,123 @@
+import os
+import json
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from operator import attrgetter
 from pathlib import Path
+from typing import Self
 
-from obelisk.filetypes import registered_types
-from obelisk.filtering import file_is_allowed
+from obelisk.filetypes import MetadataReader
+from obelisk.filtering import reader_for_name
 from obelisk.manifest import ManifestEntry
 
 
-def create_manifest_from_folder(folder_path: Path) -> list[ManifestEntry]:
-    manifest_entries: list[ManifestEntry] = []
-    for file_path in folder_path.glob('*.*'):
-        extension = file_path.suffix.lstrip('.')
+# Files changed this recently may change again within the same timestamp tick, so are never cached
+_RACY_WINDOW_NS = 2_000_000_000
 
-        # Skip filtered files
-        if not file_is_allowed(file_path):
-            continue
+# Below this many files a scan runs serially
+_MIN_PARALLEL_FILES = 8
 
-        # Figure out how to handle this file type
-        handler = registered_types.get(extension)
-        if handler is None:
-            continue
+type _StatKey = tuple[int, int, int, int]
 
-        # Gather metadata and create manifest entry
-        entry = handler(file_path)
-        if entry is not None:
-            manifest_entries.append(entry)
+
+class ScanCache:
+    """Remembers manifest entries built during scans so unchanged files are not read and hashed again.
+
+    A file is treated as unchanged while its size, inode, modification and change times all match.
+    Whole folders whose manifest is known to be up to date can also be recorded, by a fingerprint of the same
+    details for every file in them. The cache can be saved to and loaded from a file to carry it between runs.
+    """
+
+    __slots__ = ('_entries', '_folders')
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[_StatKey, ManifestEntry]] = {}
+        self._folders: dict[str, str] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> Self:
+        """Load a cache written by save, starting empty if the file is missing or unreadable."""
+        cache = cls()
+        try:
+            raw = json.loads(path.read_bytes())
+            for file_key, (size, mtime_ns, ctime_ns, ino, fields) in raw['files'].items():
+                cache._entries[file_key] = ((size, mtime_ns, ctime_ns, ino), ManifestEntry(**fields))
+            cache._folders.update({str(key): str(value) for key, value in raw['folders'].items()})
+        except (OSError, ValueError, TypeError, AttributeError, KeyError):
+            return cls()
+        return cache
+
+    def save(self, path: Path) -> None:
+        files = {file_key: [*key, asdict(entry)] for file_key, (key, entry) in self._entries.items()}
+        data = {'files': files, 'folders': self._folders}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, separators=(',', ':')), encoding='utf-8')
+
+    def folder_unchanged(self, folder_path: Path) -> bool:
+        """Check whether every file in the folder is as it was when mark_folder_checked last recorded it."""
+        fingerprint = _folder_fingerprint(folder_path)
+        return fingerprint is not None and self._folders.get(os.path.abspath(folder_path)) == fingerprint  # noqa: PTH100
+
+    def mark_folder_checked(self, folder_path: Path) -> None:
+        """Record that the folder's manifest matches its files as they are now."""
+        folder_key = os.path.abspath(folder_path)  # noqa: PTH100 - same keys as fetch
+        fingerprint = _folder_fingerprint(folder_path)
+        if fingerprint is None:
+            self._folders.pop(folder_key, None)
+        else:
+            self._folders[folder_key] = fingerprint
+
+    def fetch(self, file_path: Path, st: os.stat_result, reader: MetadataReader) -> ManifestEntry | None:
+        # Absolute paths keep keys valid for a saved cache used from another working directory
+        file_key = os.path.abspath(file_path)  # noqa: PTH100 - works on the str, cheaper than Path.absolute
+        key = (st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+        cached = self._entries.get(file_key)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        entry = reader(file_path)
+        if entry is not None and max(st.st_mtime_ns, st.st_ctime_ns) < time.time_ns() - _RACY_WINDOW_NS:
+            self._entries[file_key] = (key, entry)
+        return entry
+
+
+def create_manifest_from_folder(
+    folder_path: Path,
+    *,
+    scan_cache: ScanCache | None = None,
+    workers: int | None = None,
+) -> list[ManifestEntry]:
+    """Build manifest entries for the files directly inside a folder.
+
+    Files are read and hashed on a thread pool of up to ``workers`` threads (the executor's default if None).
+    """
+    # DirEntry caches the file type from the directory listing, so skipping directories needs no extra stat
+    with os.scandir(folder_path) as it:
+        # Filtering and choosing the reader is one lookup per name
+        candidates = [
+            (dir_entry, reader)
+            for dir_entry in it
+            if (reader := reader_for_name(dir_entry.name)) is not None and dir_entry.is_file()
+        ]
+
+    def build(candidate: tuple[os.DirEntry[str], MetadataReader]) -> ManifestEntry | None:
+        dir_entry, reader = candidate
+        file_path = folder_path / dir_entry.name
+        if scan_cache is None:
+            return reader(file_path)
+        return scan_cache.fetch(file_path, dir_entry.stat(), reader)
+
+    # Hashing happens in C with the GIL released, so threads overlap both the I/O and the hashing
+    # A handful of files is quicker to handle inline than to spin up a pool for
+    if workers == 1 or len(candidates) < _MIN_PARALLEL_FILES:
+        results = [build(candidate) for candidate in candidates]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(build, candidates))
+
+    manifest_entries = [entry for entry in results if entry is not None]
 
     # Ensure deterministic ordering for downstream comparison/writes
     manifest_entries.sort(key=attrgetter('filename'))
@@ -31,4 +125,42 @@ def create_manifest_from_folder(folder_path: Path) -> list[ManifestEntry]:
     return manifest_entries
 
 
-__all__ = ('create_manifest_from_folder',)
+def _folder_fingerprint(folder_path: Path) -> str | None:
+    """Digest the names and stat details of all files in a folder, without reading any of them.
+
+    Returns None if any file changed too recently for its timestamps to be trusted.
+    """
+    cutoff = time.time_ns() - _RACY_WINDOW_NS
+    lines: list[str] = []
+    with os.scandir(folder_path) as it:
+        for dir_entry in it:
+            if not dir_entry.is_file():
+                continue
+            st = dir_entry.stat()
+            if max(st.st_mtime_ns, st.st_ctime_ns) >= cutoff:
+                return None
+            lines.append(f'{dir_entry.name}\0{st.st_size}\0{st.st_mtime_ns}\0{st.st_ctime_ns}\0{st.st_ino}\n')
+
+    lines.sort()
+    return hashlib.md5(''.join(lines).encode('utf-8'), usedforsecurity=False).hexdigest()
+
+
+def create_manifest_entry(file_path: Path) -> ManifestEntry | None:
+    """Build the manifest entry for a single file.
+
+    Returns None for files that are filtered out, of an unregistered type, or rejected by their handler.
+    """
+    # Skip filtered files, and figure out how to handle this file type
+    reader = reader_for_name(file_path.name)
+    if reader is None or file_path.is_dir():
+        return None
+
+    # Gather metadata and create manifest entry
+    return reader(file_path)
+
+
+__all__ = (
+    'ScanCache',
+    'create_manifest_entry',
+    'create_manifest_from_folder',
+)
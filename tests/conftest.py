@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import shutil
 from typing import TYPE_CHECKING
 
 import pytest
@@ -9,23 +11,62 @@ from .mocks.git import (
     create_bare_repo,
     ensure_git_available,
     init_repo_with_commit,
+    run_git,
 )
+from obelisk import git as obelisk_git
 
 
 if TYPE_CHECKING:
     from pathlib import Path
 
 
-@pytest.fixture
-def git_remote_and_local(tmp_path: Path):
+# Applied to every git process in the session, including those run by the commands under test
+_FAST_GIT_CONFIG = {
+    'core.fsync': 'none',  # throwaway repos, no need to wait for the disk
+    'core.fsyncObjectFiles': 'false',  # the same, for git versions before core.fsync
+    'gc.auto': '0',  # never pause a command under test for housekeeping
+}
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _fast_git():
+    # Append after any config entries already given in the environment rather than replacing them
+    existing = int(os.environ.get('GIT_CONFIG_COUNT') or 0)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('GIT_CONFIG_COUNT', str(existing + len(_FAST_GIT_CONFIG)))
+        for i, (key, value) in enumerate(_FAST_GIT_CONFIG.items(), start=existing):
+            mp.setenv(f'GIT_CONFIG_KEY_{i}', key)
+            mp.setenv(f'GIT_CONFIG_VALUE_{i}', value)
+        yield
+
+
+@pytest.fixture(scope='session')
+def _git_template(tmp_path_factory: pytest.TempPathFactory):
+    # Building the repos takes a handful of git processes, so do it once and copy the result for each test
     if not ensure_git_available():
         pytest.skip('git not available on PATH')
 
-    remote = tmp_path / 'remote.git'
-    local = tmp_path / 'local_repo'
+    template = tmp_path_factory.mktemp('git_template')
+    remote = template / 'remote.git'
+    local = template / 'local_repo'
 
     create_bare_repo(remote)
     init_repo_with_commit(local, files={'README.md': 'hello'}, branch='main')
     add_remote_and_push(local, remote, branch='main')
 
     return {'local': local, 'remote': remote}
+
+
+@pytest.fixture
+def git_remote_and_local(tmp_path: Path, _git_template: dict[str, Path]):
+    # These tests run the real git, so drop any lookup cached (or faked) earlier in the session
+    obelisk_git._which_git.cache_clear()  # noqa: SLF001 # pyright: ignore[reportPrivateUsage]
+
+    remote = tmp_path / 'remote.git'
+    local = tmp_path / 'local_repo'
+
+    shutil.copytree(_git_template['remote'], remote)
+    shutil.copytree(_git_template['local'], local)
+    run_git(local, 'remote', 'set-url', 'origin', str(remote))
+
+    return {'local': local, 'remote': remote}
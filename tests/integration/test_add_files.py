@@ -4,31 +4,30 @@ from typing import TYPE_CHECKING
 
 from typer.testing import CliRunner
 
+from obelisk import scanner
 from obelisk.__main__ import app
-from obelisk.manifest import parse_manifest
+from obelisk.filetypes import registered_types
+from obelisk.manifest import parse_manifest, parse_manifest_by_name
+from tests.mocks.files import write_inputs
 
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    import pytest
 
-runner = CliRunner()
+    from obelisk.filetypes import MetadataReader
+    from obelisk.manifest import ManifestEntry
 
 
-def _write_inputs(src_dir: Path) -> tuple[Path, Path]:
-    src_dir.mkdir(parents=True, exist_ok=True)
-    j = src_dir / 'info.json'
-    p = src_dir / 'pic.png'
-    j.write_text('{"version":"1","format":"fmt"}', encoding='utf-8')
-    p.write_bytes(b'\x89PNG\r\n\x1a\n' + b'bytes')
-    return j, p
+runner = CliRunner()
 
 
 def test_add_files_happy_path_copies_and_writes_manifest(tmp_path: Path) -> None:
     # Arrange
     dest = tmp_path / 'data' / 'a'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, png_input = _write_inputs(tmp_path / 'inputs')
+    json_input, png_input = write_inputs(tmp_path / 'inputs')
 
     # Act
     res = runner.invoke(app, ['add-files', str(json_input), str(png_input), str(dest)])
@@ -44,8 +43,7 @@ def test_add_files_happy_path_copies_and_writes_manifest(tmp_path: Path) -> None
     assert manifest_path.exists()
 
     # Manifest has expected entries
-    entries = parse_manifest(manifest_path)
-    by_name = {e.filename: e for e in entries}
+    by_name = parse_manifest_by_name(manifest_path)
     assert set(by_name) == {'info.json', 'pic.png'}
     assert by_name['info.json'].version == '1'
     assert by_name['info.json'].format == 'fmt'
@@ -59,7 +57,7 @@ def test_add_files_accepts_directory_input_non_recursive(tmp_path: Path) -> None
     dest.mkdir(parents=True, exist_ok=True)
 
     inputs_dir = tmp_path / 'inputs_dir'
-    j, p = _write_inputs(inputs_dir)
+    j, p = write_inputs(inputs_dir)
     # Nested file should not be picked up (non-recursive expansion)
     nested_dir = inputs_dir / 'nested'
     nested_dir.mkdir(parents=True, exist_ok=True)
@@ -99,7 +97,7 @@ def test_add_files_dry_run_makes_no_changes(tmp_path: Path) -> None:
     # Arrange
     dest = tmp_path / 'data' / 'dry'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, png_input = _write_inputs(tmp_path / 'dry_inputs')
+    json_input, png_input = write_inputs(tmp_path / 'dry_inputs')
 
     # Act
     res = runner.invoke(app, ['add-files', '--dry-run', str(json_input), str(png_input), str(dest)])
@@ -116,7 +114,7 @@ def test_add_files_second_run_no_changes_skips_work(tmp_path: Path) -> None:
     # Arrange
     dest = tmp_path / 'data' / 'stable'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, png_input = _write_inputs(tmp_path / 'inputs_again')
+    json_input, png_input = write_inputs(tmp_path / 'inputs_again')
 
     # First run
     res1 = runner.invoke(app, ['add-files', str(json_input), str(png_input), str(dest)])
@@ -126,3 +124,114 @@ def test_add_files_second_run_no_changes_skips_work(tmp_path: Path) -> None:
     res2 = runner.invoke(app, ['add-files', str(json_input), str(png_input), str(dest)])
     assert res2.exit_code == 0, res2.output
     assert 'No manifest changes needed.' in res2.output
+
+
+def test_add_files_link_option_hard_links_files(tmp_path: Path) -> None:
+    # Arrange
+    dest = tmp_path / 'data' / 'linked'
+    dest.mkdir(parents=True, exist_ok=True)
+    json_input, png_input = write_inputs(tmp_path / 'inputs_linked')
+
+    # Act
+    res = runner.invoke(app, ['add-files', '--link', str(json_input), str(png_input), str(dest)])
+
+    # Assert: destination files are the same inodes as the inputs and the manifest is written
+    assert res.exit_code == 0, res.output
+    assert (dest / 'info.json').samefile(json_input)
+    assert (dest / 'pic.png').samefile(png_input)
+    names = {e.filename for e in parse_manifest(dest / '_manifest.json')}
+    assert names == {'info.json', 'pic.png'}
+
+
+def test_add_files_duplicate_filenames_last_input_wins(tmp_path: Path) -> None:
+    # Arrange: two input folders both provide info.json
+    dest = tmp_path / 'data' / 'dupes'
+    dest.mkdir(parents=True, exist_ok=True)
+    first_json, _ = write_inputs(tmp_path / 'first')
+    second_json, _ = write_inputs(tmp_path / 'second')
+    second_json.write_text('{"version":"2","format":"other"}', encoding='utf-8')
+
+    # Act
+    res = runner.invoke(app, ['add-files', str(first_json.parent), str(second_json.parent), str(dest)])
+
+    # Assert: the later input is the one copied
+    assert res.exit_code == 0, res.output
+    assert (dest / 'info.json').read_text(encoding='utf-8') == second_json.read_text(encoding='utf-8')
+    entries = parse_manifest(dest / '_manifest.json')
+    assert [e.filename for e in entries] == ['info.json', 'pic.png']
+    assert entries[0].version == '2'
+
+
+def test_add_files_trust_manifest_uses_existing_manifest(tmp_path: Path) -> None:
+    # Arrange: an initial import, then an untracked edit to a file outside the next import
+    dest = tmp_path / 'data' / 'trusted'
+    dest.mkdir(parents=True, exist_ok=True)
+    (dest / 'old.json').write_text('{"version":"5","format":"fmt"}', encoding='utf-8')
+    json_input, png_input = write_inputs(tmp_path / 'inputs_trusted')
+    assert runner.invoke(app, ['add-files', str(json_input), str(png_input), str(dest)]).exit_code == 0
+    (dest / 'old.json').write_text('{"version":"5","format":"changed"}', encoding='utf-8')
+    json_input.write_text('{"version":"2","format":"new"}', encoding='utf-8')
+
+    # Act
+    res = runner.invoke(app, ['add-files', '--trust-manifest', str(json_input), str(dest)])
+
+    # Assert: the imported file is refreshed while the untouched entry comes from the manifest as-is
+    assert res.exit_code == 0, res.output
+    by_name = parse_manifest_by_name(dest / '_manifest.json')
+    assert by_name['info.json'].format == 'new'
+    assert by_name['old.json'].format == 'fmt'
+
+
+def test_add_files_keeps_existing_destination_entries(tmp_path: Path) -> None:
+    # Arrange: destination already holds a file that is not part of this import
+    dest = tmp_path / 'data' / 'existing'
+    dest.mkdir(parents=True, exist_ok=True)
+    (dest / 'old.json').write_text('{"version":"5","format":"fmt"}', encoding='utf-8')
+    json_input, png_input = write_inputs(tmp_path / 'inputs_existing')
+
+    # Act
+    res = runner.invoke(app, ['add-files', str(json_input), str(png_input), str(dest)])
+
+    # Assert: manifest lists both the pre-existing and the newly copied files
+    assert res.exit_code == 0, res.output
+    entries = parse_manifest(dest / '_manifest.json')
+    assert [e.filename for e in entries] == ['info.json', 'old.json', 'pic.png']
+    assert entries[1].version == '5'
+
+
+def test_add_files_stat_cache_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange: files written by the test are brand new, so allow caching them straight away
+    monkeypatch.setattr(scanner, '_RACY_WINDOW_NS', 0)
+    dest = tmp_path / 'data' / 'cached'
+    dest.mkdir(parents=True, exist_ok=True)
+    (dest / 'old.json').write_text('{"version":"5","format":"fmt"}', encoding='utf-8')
+    cache_file = tmp_path / 'cache' / 'stats.json'
+    json_input, png_input = write_inputs(tmp_path / 'inputs_cached')
+
+    res1 = runner.invoke(app, ['add-files', '--stat-cache', str(cache_file), str(json_input), str(dest)])
+    assert res1.exit_code == 0, res1.output
+    assert cache_file.exists()
+
+    # Record which files are actually read from here on
+    read_names: list[str] = []
+    for ext in ('json', 'png'):
+        reader = registered_types[ext]
+
+        def recording_reader(path: Path, reader: MetadataReader = reader) -> ManifestEntry | None:
+            read_names.append(path.name)
+            return reader(path)
+
+        monkeypatch.setitem(registered_types, ext, recording_reader)
+
+    # Act: import another file with the saved cache
+    res2 = runner.invoke(app, ['add-files', '--stat-cache', str(cache_file), str(png_input), str(dest)])
+
+    # Assert: the file scanned last time comes from the cache, and only the new import is read
+    assert res2.exit_code == 0, res2.output
+    assert 'old.json' not in read_names
+    assert 'pic.png' in read_names
+
+    # The manifest still lists every file with its details
+    by_name = parse_manifest_by_name(dest / '_manifest.json')
+    assert sorted(by_name) == ['info.json', 'old.json', 'pic.png']
+    assert by_name['old.json'].version == '5'
@@ -5,7 +5,8 @@ from typing import TYPE_CHECKING, TypedDict
 from typer.testing import CliRunner
 
 from obelisk.__main__ import app
-from obelisk.manifest import parse_manifest
+from obelisk.manifest import parse_manifest_by_name
+from tests.mocks.files import write_inputs
 from tests.mocks.git import run_git
 
 
@@ -38,15 +39,6 @@ def _git_is_clean(repo: Path) -> bool:
     return run_git(repo, 'status', '--porcelain').stdout.strip() == ''
 
 
-def _write_inputs(src_dir: Path) -> tuple[Path, Path]:
-    src_dir.mkdir(parents=True, exist_ok=True)
-    j = src_dir / 'info.json'
-    p = src_dir / 'pic.png'
-    j.write_text('{"version":"1","format":"fmt"}', encoding='utf-8')
-    p.write_bytes(b'\x89PNG\r\n\x1a\n' + b'bytes')
-    return j, p
-
-
 def test_live_import_happy_path_commits_and_pushes(tmp_path: Path, git_remote_and_local: GitRepos) -> None:
     # Arrange: setup local/remote, destination folder inside local repo, and input files
     local = git_remote_and_local['local']
@@ -56,7 +48,7 @@ def test_live_import_happy_path_commits_and_pushes(tmp_path: Path, git_remote_an
     dest.mkdir(parents=True, exist_ok=True)
 
     inputs_dir = tmp_path / 'inputs'
-    json_input, png_input = _write_inputs(inputs_dir)
+    json_input, png_input = write_inputs(inputs_dir)
 
     # Capture remote main before import
     remote_hash_before = _git_hash_remote_main(remote)
@@ -86,8 +78,7 @@ def test_live_import_happy_path_commits_and_pushes(tmp_path: Path, git_remote_an
     assert manifest_path.exists()
 
     # Manifest has expected entries
-    entries = parse_manifest(manifest_path)
-    by_name = {e.filename: e for e in entries}
+    by_name = parse_manifest_by_name(manifest_path)
     assert set(by_name) == {'info.json', 'pic.png'}
     assert by_name['info.json'].version == '1'
     assert by_name['info.json'].format == 'fmt'
@@ -116,7 +107,7 @@ def test_live_import_skip_pull_implies_skip_push(tmp_path: Path, git_remote_and_
     remote = git_remote_and_local['remote']
     dest = local / 'data' / 'b'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, png_input = _write_inputs(tmp_path / 'inputs2')
+    json_input, png_input = write_inputs(tmp_path / 'inputs2')
 
     remote_hash_before = _git_hash_remote_main(remote)
 
@@ -176,7 +167,7 @@ def test_live_import_custom_message_and_no_file_list(tmp_path: Path, git_remote_
     local = git_remote_and_local['local']
     dest = local / 'data' / 'c'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, _ = _write_inputs(tmp_path / 'inputs3')
+    json_input, _ = write_inputs(tmp_path / 'inputs3')
 
     # Act
     res = runner.invoke(
@@ -211,7 +202,7 @@ def test_live_import_second_run_no_changes_skips_commit(tmp_path: Path, git_remo
     remote = git_remote_and_local['remote']
     dest = local / 'data' / 'stable'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, png_input = _write_inputs(tmp_path / 'inputs4')
+    json_input, png_input = write_inputs(tmp_path / 'inputs4')
 
     # First run commits and pushes
     res1 = runner.invoke(
@@ -240,7 +231,7 @@ def test_live_import_version_only_change_skips_commit_and_copy(
     remote = git_remote_and_local['remote']
     dest = local / 'data' / 'stable-version'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, png_input = _write_inputs(tmp_path / 'inputs_version')
+    json_input, png_input = write_inputs(tmp_path / 'inputs_version')
 
     res1 = runner.invoke(
         app, ['live-import', '--repo', str(local), str(json_input), str(png_input), 'data/stable-version'],
@@ -278,7 +269,7 @@ def test_live_import_rejects_parent_traversal_in_dest(tmp_path: Path, git_remote
     local = git_remote_and_local['local']
     # Valid folder we intend to import to (exists), but pass '../x' in dest
     (local / 'data' / 'ok').mkdir(parents=True, exist_ok=True)
-    json_input, _ = _write_inputs(tmp_path / 'inputs5')
+    json_input, _ = write_inputs(tmp_path / 'inputs5')
 
     # Act
     res = runner.invoke(
@@ -297,7 +288,7 @@ def test_live_import_dry_run_new_import_no_changes(tmp_path: Path, git_remote_an
     remote = git_remote_and_local['remote']
     dest = local / 'data' / 'dry1'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, png_input = _write_inputs(tmp_path / 'dry_inputs1')
+    json_input, png_input = write_inputs(tmp_path / 'dry_inputs1')
 
     local_head_before = _git_hash_head(local)
     remote_hash_before = _git_hash_remote_main(remote)
@@ -338,7 +329,7 @@ def test_live_import_dry_run_on_existing_content_is_noop(
     dest = local / 'data' / 'dry2'
     dest.mkdir(parents=True, exist_ok=True)
 
-    inputs_a = _write_inputs(tmp_path / 'dry_inputs2_a')
+    inputs_a = write_inputs(tmp_path / 'dry_inputs2_a')
     res1 = runner.invoke(
         app,
         ['live-import', '--repo', str(local), str(inputs_a[0]), str(inputs_a[1]), 'data/dry2'],
@@ -381,7 +372,7 @@ def test_live_import_dry_run_with_skip_pull_prints_and_no_changes(
     remote = git_remote_and_local['remote']
     dest = local / 'data' / 'dry3'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, _ = _write_inputs(tmp_path / 'dry_inputs3')
+    json_input, _ = write_inputs(tmp_path / 'dry_inputs3')
     local_head_before = _git_hash_head(local)
     remote_hash_before = _git_hash_remote_main(remote)
 
@@ -409,7 +400,7 @@ def test_live_import_blocks_on_dirty_repo_without_skip_pull(
     remote = git_remote_and_local['remote']
     dest = local / 'data' / 'dirty1'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, png_input = _write_inputs(tmp_path / 'dirty_inputs1')
+    json_input, png_input = write_inputs(tmp_path / 'dirty_inputs1')
 
     # Make repo dirty
     (local / 'README.md').write_text('hello (dirty)', encoding='utf-8')
@@ -445,7 +436,7 @@ def test_live_import_dirty_repo_with_skip_pull_commits_and_skips_push(
     remote = git_remote_and_local['remote']
     dest = local / 'data' / 'dirty2'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, png_input = _write_inputs(tmp_path / 'dirty_inputs2')
+    json_input, png_input = write_inputs(tmp_path / 'dirty_inputs2')
 
     # Dirty the repo
     (local / 'README.md').write_text('hello (dirty2)', encoding='utf-8')
@@ -484,7 +475,7 @@ def test_live_import_git_reset_does_not_override_dirty_block(
     local = git_remote_and_local['local']
     dest = local / 'data' / 'dirty3'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, _ = _write_inputs(tmp_path / 'dirty_inputs3')
+    json_input, _ = write_inputs(tmp_path / 'dirty_inputs3')
 
     # Dirty the repo
     (local / 'README.md').write_text('hello (dirty3)', encoding='utf-8')
@@ -509,7 +500,7 @@ def test_live_import_dry_run_allows_dirty_repo(
     remote = git_remote_and_local['remote']
     dest = local / 'data' / 'dirty4'
     dest.mkdir(parents=True, exist_ok=True)
-    json_input, png_input = _write_inputs(tmp_path / 'dirty_inputs4')
+    json_input, png_input = write_inputs(tmp_path / 'dirty_inputs4')
 
     # Dirty the repo
     (local / 'README.md').write_text('hello (dirty4)', encoding='utf-8')
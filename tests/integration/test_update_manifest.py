@@ -4,13 +4,17 @@ from typing import TYPE_CHECKING
 
 from typer.testing import CliRunner
 
+from obelisk import scanner
 from obelisk.__main__ import app
-from obelisk.manifest import parse_manifest
+from obelisk.manifest import parse_manifest_by_name
+from obelisk.scanner import create_manifest_from_folder
 
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    import pytest
+
 
 runner = CliRunner()
 
@@ -58,8 +62,7 @@ def test_update_manifest_updates_single_file(tmp_path: Path) -> None:
     # Initial manifest
     res1 = runner.invoke(app, ['update-manifest', str(folder)])
     assert res1.exit_code == 0, res1.output
-    before_entries = parse_manifest(folder / '_manifest.json')
-    before_by_name = {e.filename: e for e in before_entries}
+    before_by_name = parse_manifest_by_name(folder / '_manifest.json')
     assert before_by_name['a.json'].version == '1'
     assert before_by_name['a.json'].metadata == {'foo': 'bar'}
     assert before_by_name['b.json'].version == '2'
@@ -74,9 +77,8 @@ def test_update_manifest_updates_single_file(tmp_path: Path) -> None:
     assert res2.exit_code == 0, res2.output
     assert 'Changes detected in the manifest.' in res2.output
 
-    after_entries = parse_manifest(folder / '_manifest.json')
-    after_by_name = {e.filename: e for e in after_entries}
-    assert len(after_entries) == 2
+    after_by_name = parse_manifest_by_name(folder / '_manifest.json')
+    assert len(after_by_name) == 2
     assert after_by_name['a.json'].version == '1'
     assert after_by_name['a.json'].metadata == {'foo': 'baz'}
     assert after_by_name['b.json'].version == '2'  # unchanged
@@ -148,10 +150,9 @@ def test_update_manifest_creates_json_and_binary(tmp_path: Path) -> None:
     mpath = folder / '_manifest.json'
     assert mpath.exists(), 'Manifest should be created when missing'
 
-    entries = parse_manifest(mpath)
-    by_name = {e.filename: e for e in entries}
+    by_name = parse_manifest_by_name(mpath)
 
-    assert len(entries) == 2
+    assert len(by_name) == 2
     assert 'info.json' in by_name
     assert 'pic.png' in by_name
     assert by_name['info.json'].version == '9'
@@ -261,3 +262,91 @@ def test_update_manifest_dry_run_does_not_delete_on_empty(tmp_path: Path) -> Non
     assert 'Changes detected in the manifest.' in res2.output
     assert 'would delete existing manifest' in res2.output
     assert manifest.exists(), 'Manifest should not be deleted in dry-run mode'
+
+
+def test_update_manifest_stat_cache_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange: files written by the test are brand new, so allow caching them straight away
+    monkeypatch.setattr(scanner, '_RACY_WINDOW_NS', 0)
+    folder = tmp_path / 'data'
+    folder.mkdir()
+    cache_file = tmp_path / 'cache' / 'stats.json'
+
+    (folder / 'a.json').write_text('{"version":"1"}', encoding='utf-8')
+    (folder / 'img.png').write_bytes(b'\x89PNG\r\n\x1a\n' + b'bytes')
+
+    res1 = runner.invoke(app, ['update-manifest', '--stat-cache', str(cache_file), str(folder)])
+    assert res1.exit_code == 0, res1.output
+    assert cache_file.exists()
+
+    # Act: change one file and run again with the saved cache
+    (folder / 'a.json').write_text('{"version":"1","format":"changed"}', encoding='utf-8')
+    res2 = runner.invoke(app, ['update-manifest', '--stat-cache', str(cache_file), str(folder)])
+
+    # Assert: the change is picked up and the untouched file keeps its entry
+    assert res2.exit_code == 0, res2.output
+    by_name = parse_manifest_by_name(folder / '_manifest.json')
+    assert by_name['a.json'].format == 'changed'
+    assert by_name['img.png'].hash is not None
+    assert by_name['img.png'].hash.startswith('md5:')
+
+
+def test_update_manifest_stat_cache_saved_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange: a folder whose manifest is already up to date
+    monkeypatch.setattr(scanner, '_RACY_WINDOW_NS', 0)
+    folder = tmp_path / 'data'
+    folder.mkdir()
+    cache_file = tmp_path / 'stats.json'
+    (folder / 'a.json').write_text('{"version":"1"}', encoding='utf-8')
+    args = ['update-manifest', '--stat-cache', str(cache_file), str(folder)]
+    assert runner.invoke(app, args).exit_code == 0
+
+    saved: list[Path] = []
+    original_save = scanner.ScanCache.save
+
+    def counting_save(self: scanner.ScanCache, path: Path) -> None:
+        saved.append(path)
+        original_save(self, path)
+
+    monkeypatch.setattr(scanner.ScanCache, 'save', counting_save)
+
+    # Act: the scan finds no changes, and the folder is recorded as checked
+    res = runner.invoke(app, args)
+
+    # Assert: the cache, including the checked folder, is written a single time
+    assert res.exit_code == 0, res.output
+    assert 'No updates necessary' in res.output
+    assert saved == [cache_file]
+
+
+def test_update_manifest_stat_cache_skips_unchanged(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange: a folder whose manifest has been confirmed up to date once with the cache
+    monkeypatch.setattr(scanner, '_RACY_WINDOW_NS', 0)
+    folder = tmp_path / 'data'
+    folder.mkdir()
+    cache_file = tmp_path / 'stats.json'
+    (folder / 'a.json').write_text('{"version":"1"}', encoding='utf-8')
+
+    args = ['update-manifest', '--stat-cache', str(cache_file), str(folder)]
+    assert runner.invoke(app, args).exit_code == 0
+    assert runner.invoke(app, args).exit_code == 0
+
+    # Act: run again with scanning disabled
+    def fail_scan(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError('folder should not be rescanned')
+
+    scan_target = 'obelisk.commands.update_manifest.create_manifest_from_folder'
+    monkeypatch.setattr(scan_target, fail_scan)
+    res = runner.invoke(app, args)
+
+    # Assert
+    assert res.exit_code == 0, res.output
+    assert 'No updates necessary' in res.output
+
+    # A changed file is noticed again, and the folder rescanned for real
+    monkeypatch.setattr(scan_target, create_manifest_from_folder)
+    (folder / 'a.json').write_text('{"version":"1","format":"x"}', encoding='utf-8')
+    res_changed = runner.invoke(app, args)
+    assert res_changed.exit_code == 0, res_changed.output
+    assert 'Changes detected in the manifest.' in res_changed.output
+    manifest = parse_manifest_by_name(folder / '_manifest.json')
+    assert manifest['a.json'].format == 'x'
@@ -1,37 +1,73 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import TYPE_CHECKING
+import os
+from typing import TYPE_CHECKING, Self
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from pathlib import Path
 
     import pytest
 
 
-def patch_path_glob_for_folder(
+def patch_scandir_for_folder(
     monkeypatch: pytest.MonkeyPatch,
     match_folder: Path,
-    match_pattern: str,
-    files: Iterable[Path],
+    order: list[str],
 ) -> None:
-    """Monkeypatch Path.glob to return a provided iterable for one folder.
+    """Monkeypatch os.scandir to list one folder's entries in a provided name order.
 
-    This limits the override to a single directory and pattern, delegating to
-    the original glob implementation for all other calls.
+    The real directory entries are used, only their order changes.
+    This limits the override to a single directory, delegating to
+    the original scandir implementation for all other calls.
     The `monkeypatch` fixture will automatically restore the original after
     the test, so no explicit teardown is required.
     """
 
-    original_glob = Path.glob
+    original_scandir = os.scandir
 
-    def fake_glob(self: Path, pattern: str):
-        if self == match_folder and pattern == match_pattern:
-            return iter(files)
-        return original_glob(self, pattern)
+    class _OrderedScandir:
+        def __init__(self, entries: list[os.DirEntry[str]]) -> None:
+            self._entries = entries
 
-    monkeypatch.setattr(Path, 'glob', fake_glob, raising=True)
+        def __enter__(self) -> Self:
+            return self
 
+        def __exit__(self, *_: object) -> None:
+            return None
 
-__all__ = ('patch_path_glob_for_folder',)
+        def __iter__(self):
+            return iter(self._entries)
+
+    def fake_scandir(path: str | Path = '.'):
+        if path == match_folder:
+            with original_scandir(path) as it:
+                by_name = {entry.name: entry for entry in it}
+            return _OrderedScandir([by_name[name] for name in order])
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', fake_scandir, raising=True)
+
+
+_INPUT_JSON = b'{"version":"1","format":"fmt"}'
+_INPUT_PNG = b'\x89PNG\r\n\x1a\nbytes'
+
+
+def write_inputs(src_dir: Path) -> tuple[Path, Path]:
+    """Write a small JSON and PNG input pair into `src_dir`, returning their paths.
+
+    The files are written fresh for each call rather than linked from a shared
+    copy, as some tests edit their inputs in place.
+    """
+    src_dir.mkdir(parents=True, exist_ok=True)
+    j = src_dir / 'info.json'
+    p = src_dir / 'pic.png'
+    j.write_bytes(_INPUT_JSON)
+    p.write_bytes(_INPUT_PNG)
+    return j, p
+
+
+__all__ = (
+    'patch_scandir_for_folder',
+    'write_inputs',
+)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import shutil
 import subprocess
+from functools import cache
 from typing import TYPE_CHECKING
 
 
@@ -14,7 +16,7 @@ def run_git(cwd: Path, *args: str) -> subprocess.CompletedProcess[str]:
         cwd=str(cwd),
         check=True,
         capture_output=True,
-        text=True,
+        encoding='utf-8',  # fixed rather than text=True, so there is no locale lookup per call
     )
 
 
@@ -23,23 +25,37 @@ def create_bare_repo(path: Path) -> None:
     run_git(path, 'init', '--bare')
 
 
+# Identity, with signing (both commits and tags) disabled explicitly - including SSH signing in newer Git
+_TEST_CONFIG = """
+[user]
+\tname = Obelisk Test
+\temail = obelisk-test@example.invalid
+[commit]
+\tgpgsign = false
+[tag]
+\tgpgsign = false
+[gpg]
+\tformat = openpgp
+[gpg "ssh"]
+\tallowedSignersFile =
+\tdefaultKeyCommand =
+"""
+
+
 def _configure_test_identity(path: Path) -> None:
     """Configure a temporary test-only identity and disable signing in the repo.
 
     We set per-repository configuration so it takes precedence over any user/global
     config the developer or CI might have. This prevents signing prompts and ensures
     commits can be created without depending on global identity.
+
+    The settings are appended to the repository's config file directly, rather than
+    spawning a `git config` process for each of them.
     """
-    # Identity
-    run_git(path, 'config', 'user.name', 'Obelisk Test')
-    run_git(path, 'config', 'user.email', 'obelisk-test@example.invalid')
-    # Disable signing (both commits and tags) explicitly
-    run_git(path, 'config', 'commit.gpgsign', 'false')
-    run_git(path, 'config', 'tag.gpgsign', 'false')
-    # If SSH signing is enabled in newer Git, disable it too
-    run_git(path, 'config', 'gpg.format', 'openpgp')  # keep default but explicit
-    run_git(path, 'config', 'gpg.ssh.allowedSignersFile', '')
-    run_git(path, 'config', 'gpg.ssh.defaultKeyCommand', '')
+    config_path = path / '.git' / 'config'
+    config = config_path.read_text(encoding='utf-8')
+    if _TEST_CONFIG not in config:
+        config_path.write_text(config + _TEST_CONFIG, encoding='utf-8')
 
 
 def init_repo_with_commit(
@@ -70,13 +86,7 @@ def add_remote_and_push(local: Path, remote: Path, remote_name: str = 'origin',
     run_git(local, 'push', remote_name, branch, '--set-upstream')
 
 
+@cache
 def ensure_git_available() -> bool:
-    try:
-        subprocess.run(
-            ['git', '--version'],  # noqa: S607 - we intentionally want to use git from PATH
-            capture_output=True,
-            check=True,
-        )
-        return True
-    except Exception:
-        return False
+    # A PATH lookup is enough here - a broken git install still fails loudly in run_git
+    return shutil.which('git') is not None
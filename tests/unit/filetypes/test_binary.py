@@ -55,3 +55,27 @@ def test_get_metadata_from_binary_chunked_read(tmp_path: Path) -> None:
     assert entry is not None
     assert entry.filename == 'large.bin'
     assert entry.hash == _expected_hash(data)
+
+
+def test_get_metadata_from_binary_buffered_read(tmp_path: Path) -> None:
+    # Content between the single-read and memory-mapping thresholds is streamed through a buffer
+    data = bytes(range(256)) * 2048 + b'TAIL'
+    p = tmp_path / 'medium.bin'
+    p.write_bytes(data)
+
+    entry = bin_ft.get_metadata_from_binary(p)
+
+    assert entry is not None
+    assert entry.hash == _expected_hash(data)
+
+
+def test_get_metadata_from_binary_mapped_read(tmp_path: Path) -> None:
+    # Content over the 1 MiB memory-mapping threshold takes the mmap path
+    data = bytes(range(256)) * 4096 + b'TAIL'
+    p = tmp_path / 'huge.bin'
+    p.write_bytes(data)
+
+    entry = bin_ft.get_metadata_from_binary(p)
+
+    assert entry is not None
+    assert entry.hash == _expected_hash(data)
@@ -6,22 +6,39 @@ import pytest
 import obelisk.filetypes.json as json_ft
 
 
+# tests/data
+_DATA_DIR = Path(__file__).parents[2] / 'data'
+
+
 def _data_path(name: str) -> Path:
-    # tests/data/<name>
-    return Path(__file__).parents[2] / 'data' / name
+    return _DATA_DIR / name
+
+
+class _FakeLoader:
+    """Stands in for _load_json, returning whatever the test last assigned to ``data``."""
+
+    data: Any = None
+
+    def __call__(self, _: Path) -> Any:
+        return self.data
+
 
+@pytest.fixture
+def fake_loader(monkeypatch: pytest.MonkeyPatch) -> _FakeLoader:
+    # Patched once per test; tests swap the loaded data by plain assignment
+    loader = _FakeLoader()
+    monkeypatch.setattr(json_ft, '_load_json', loader)
+    return loader
 
-def test_get_metadata_from_json_valid_with_mock(monkeypatch: pytest.MonkeyPatch) -> None:
+
+def test_get_metadata_from_json_valid_with_mock(fake_loader: _FakeLoader) -> None:
     # Arrange: mock loader to return a simple, valid dict
-    def fake_load(_: Path) -> dict[str, Any]:
-        return {
-            'version': '1.0.0',
-            'format': 'custom-format',
-            'mod': {'id': 1, 'name': 'Demo'},
-            'other': 123,
-        }
-
-    monkeypatch.setattr(json_ft, '_load_json', fake_load)
+    fake_loader.data = {
+        'version': '1.0.0',
+        'format': 'custom-format',
+        'mod': {'id': 1, 'name': 'Demo'},
+        'other': 123,
+    }
     p = Path('dummy.json')
 
     # Act
@@ -38,14 +55,11 @@ def test_get_metadata_from_json_valid_with_mock(monkeypatch: pytest.MonkeyPatch)
     assert entry.json_hash.startswith('md5json:')
 
 
-def test_get_metadata_from_json_with_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_load(_: Path) -> dict[str, Any]:
-        return {
-            'version': '3.0',
-            'metadata': {'source': 'tests', 'tags': ['beta', 'json']},
-        }
-
-    monkeypatch.setattr(json_ft, '_load_json', fake_load)
+def test_get_metadata_from_json_with_metadata(fake_loader: _FakeLoader) -> None:
+    fake_loader.data = {
+        'version': '3.0',
+        'metadata': {'source': 'tests', 'tags': ['beta', 'json']},
+    }
 
     entry = json_ft.get_metadata_from_json(Path('dummy.json'))
 
@@ -55,78 +69,48 @@ def test_get_metadata_from_json_with_metadata(monkeypatch: pytest.MonkeyPatch) -
     assert entry.json_hash is not None
 
 
-def test_get_metadata_from_json_non_dict_with_mock(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Arrange: loader returns a non-dict (invalid)
-    def fake_load(_: Path) -> list[int]:
-        return [1, 2, 3]
-
-    monkeypatch.setattr(json_ft, '_load_json', fake_load)
-
-    # Act / Assert
-    assert json_ft.get_metadata_from_json(Path('dummy.json')) is None
-
-
-def test_get_metadata_from_json_missing_version_with_mock(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Arrange: loader returns dict with no version
-    def fake_load(_: Path) -> dict[str, Any]:
-        return {'format': 'x'}
-
-    monkeypatch.setattr(json_ft, '_load_json', fake_load)
-
-    # Act / Assert
-    assert json_ft.get_metadata_from_json(Path('dummy.json')) is None
-
-
-def test_get_metadata_from_json_non_string_version_with_mock(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Arrange: loader returns dict with non-string version
-    def fake_load(_: Path) -> dict[str, Any]:
-        return {'version': 123, 'format': 'x'}
-
-    monkeypatch.setattr(json_ft, '_load_json', fake_load)
+@pytest.mark.parametrize(
+    'data',
+    [
+        pytest.param(None, id='loader-returns-none'),  # loader failed
+        pytest.param([1, 2, 3], id='non-dict'),
+        pytest.param({'format': 'x'}, id='missing-version'),
+        pytest.param({'version': 123, 'format': 'x'}, id='non-string-version'),
+    ],
+)
+def test_get_metadata_from_json_rejected(fake_loader: _FakeLoader, data: Any) -> None:
+    # Arrange
+    fake_loader.data = data
 
     # Act / Assert
     assert json_ft.get_metadata_from_json(Path('dummy.json')) is None
 
 
-def test_get_metadata_from_json_format_not_string(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Arrange: loader returns dict with non-string format (should coerce to None)
-    def fake_load(_: Path) -> dict[str, Any]:
-        return {'version': '2.0', 'format': 42, 'mod': {'a': 1}}
-
-    monkeypatch.setattr(json_ft, '_load_json', fake_load)
+@pytest.mark.parametrize(
+    ('data', 'field'),
+    [
+        pytest.param({'version': '2.0', 'format': 42, 'mod': {'a': 1}}, 'format', id='format-not-string'),
+        pytest.param({'version': '2.1', 'format': 'fmt', 'mod': [1, 2, 3]}, 'mod', id='mod-not-dict'),
+    ],
+)
+def test_get_metadata_from_json_bad_field_coerced_to_none(
+    fake_loader: _FakeLoader,
+    data: dict[str, Any],
+    field: str,
+) -> None:
+    # Arrange: a valid file apart from one field of the wrong type
+    fake_loader.data = data
 
+    # Act
     entry = json_ft.get_metadata_from_json(Path('dummy.json'))
-    assert entry is not None
-    assert entry.format is None
-    assert entry.hash is None
-    assert entry.json_hash is not None
-
-
-def test_get_metadata_from_json_mod_not_dict(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Arrange: loader returns dict with non-dict mod (should coerce to None)
-    def fake_load(_: Path) -> dict[str, Any]:
-        return {'version': '2.1', 'format': 'fmt', 'mod': [1, 2, 3]}
 
-    monkeypatch.setattr(json_ft, '_load_json', fake_load)
-
-    entry = json_ft.get_metadata_from_json(Path('dummy.json'))
+    # Assert: the entry is still produced, without the bad field
     assert entry is not None
-    assert entry.mod is None
+    assert getattr(entry, field) is None
     assert entry.hash is None
     assert entry.json_hash is not None
 
 
-def test_get_metadata_from_json_loader_returns_none(monkeypatch: pytest.MonkeyPatch) -> None:
-    # Arrange: loader fails / returns None
-    def fake_load(_: Path) -> None:  # type: ignore[override]
-        return None
-
-    monkeypatch.setattr(json_ft, '_load_json', fake_load)
-
-    # Act / Assert
-    assert json_ft.get_metadata_from_json(Path('dummy.json')) is None
-
-
 @pytest.mark.parametrize(
     ('filename', 'expected_version', 'expected_format', 'expected_mod_checks'),
     [
@@ -169,17 +153,11 @@ def test_get_metadata_from_json_with_real_files(
     assert entry.json_hash.startswith('md5json:')
 
 
-def test_get_metadata_from_json_hash_changes_with_content(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_load_v1(_: Path) -> dict[str, Any]:
-        return {'version': '1', 'data': {'a': 1}}
-
-    def fake_load_v2(_: Path) -> dict[str, Any]:
-        return {'version': '2', 'data': {'a': 2}}
-
-    monkeypatch.setattr(json_ft, '_load_json', fake_load_v1)
+def test_get_metadata_from_json_hash_changes_with_content(fake_loader: _FakeLoader) -> None:
+    fake_loader.data = {'version': '1', 'data': {'a': 1}}
     entry1 = json_ft.get_metadata_from_json(Path('dummy.json'))
 
-    monkeypatch.setattr(json_ft, '_load_json', fake_load_v2)
+    fake_loader.data = {'version': '2', 'data': {'a': 2}}
     entry2 = json_ft.get_metadata_from_json(Path('dummy.json'))
 
     assert entry1 is not None
@@ -188,18 +166,12 @@ def test_get_metadata_from_json_hash_changes_with_content(monkeypatch: pytest.Mo
     assert entry1.json_hash != entry2.json_hash
 
 
-def test_get_metadata_from_json_hash_changes_with_key_order(monkeypatch: pytest.MonkeyPatch) -> None:
-    def fake_load_order1(_: Path) -> dict[str, Any]:
-        return {'version': '1', 'payload': {'a': 1, 'b': 2}}
-
-    def fake_load_order2(_: Path) -> dict[str, Any]:
-        # Same keys/values but different order should change the hash when order matters
-        return {'version': '1', 'payload': {'b': 2, 'a': 1}}
-
-    monkeypatch.setattr(json_ft, '_load_json', fake_load_order1)
+def test_get_metadata_from_json_hash_changes_with_key_order(fake_loader: _FakeLoader) -> None:
+    fake_loader.data = {'version': '1', 'payload': {'a': 1, 'b': 2}}
     entry1 = json_ft.get_metadata_from_json(Path('dummy.json'))
 
-    monkeypatch.setattr(json_ft, '_load_json', fake_load_order2)
+    # Same keys/values but different order should change the hash when order matters
+    fake_loader.data = {'version': '1', 'payload': {'b': 2, 'a': 1}}
     entry2 = json_ft.get_metadata_from_json(Path('dummy.json'))
 
     assert entry1 is not None
@@ -39,6 +39,24 @@ def test_build_file_change_list_all_kinds():
     assert text.splitlines() == expected_lines
 
 
+def test_build_file_change_list_accepts_unsorted_inputs():
+    before = [make_entry('c.json', version='1'), make_entry('a.json', version='1')]
+    after = [make_entry('b.json', version='1'), make_entry('a.json', version='2')]
+
+    text = build_file_change_list(before, after)
+
+    assert text.splitlines() == [
+        'Added:',
+        '* b.json (v1)',
+        '',
+        'Updated:',
+        '* a.json (v2)',
+        '',
+        'Removed:',
+        '* c.json',
+    ]
+
+
 def test_build_commit_message_default_headline_and_list():
     # Arrange
     before = [make_entry('a.json', version='1.0')]
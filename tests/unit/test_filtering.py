@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from obelisk.filetypes import registered_types
+from obelisk.filtering import name_is_allowed, reader_for_name
+from obelisk.manifest import MANIFEST_FILENAME
+
+
+@pytest.mark.parametrize(
+    'filename',
+    ['info.json', 'settings.jsonc', 'pic.png', 'photo.jpg', 'photo.jpeg', 'mod.v2.json'],
+)
+def test_name_is_allowed_registered_extensions(filename: str) -> None:
+    assert name_is_allowed(filename) is True
+
+
+@pytest.mark.parametrize(
+    'filename',
+    [
+        pytest.param(MANIFEST_FILENAME, id='manifest'),
+        pytest.param('_draft.json', id='underscored'),
+        pytest.param('.hidden.json', id='hidden'),
+        pytest.param('notes.txt', id='unregistered-extension'),
+        pytest.param('json', id='no-extension'),
+        pytest.param('info.json.bak', id='registered-extension-not-last'),
+        pytest.param('', id='empty'),
+    ],
+)
+def test_name_is_allowed_rejects(filename: str) -> None:
+    assert name_is_allowed(filename) is False
+
+
+@pytest.mark.parametrize('filename', ['INFO.JSON', 'pic.PNG', 'photo.Jpg'])
+def test_name_is_allowed_extension_is_case_sensitive(filename: str) -> None:
+    # Extensions are matched exactly as registered, which are all lower case
+    assert name_is_allowed(filename) is False
+
+
+def test_reader_for_name_returns_registered_handler() -> None:
+    assert reader_for_name('info.json') is registered_types['json']
+    assert reader_for_name('pic.png') is registered_types['png']
+
+
+@pytest.mark.parametrize('filename', [MANIFEST_FILENAME, '.hidden.png', 'notes.txt', 'pic.PNG'])
+def test_reader_for_name_rejected_names_have_no_reader(filename: str) -> None:
+    assert reader_for_name(filename) is None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import subprocess as _sub
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -9,9 +10,24 @@ from obelisk import git
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
 
+@pytest.fixture(autouse=True)
+def _git_on_path(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    # Resolve git to a plain name (tests about a missing git patch it again)
+    # The lookup is cached for the process, so forget it both before and after, or a faked path leaks out
+    git._which_git.cache_clear()  # noqa: SLF001 # pyright: ignore[reportPrivateUsage]
+    monkeypatch.setattr(git.shutil, 'which', lambda _name: 'git')  # type: ignore
+    yield
+    git._which_git.cache_clear()  # noqa: SLF001 # pyright: ignore[reportPrivateUsage]
+
+
+# Stands in for a CompletedProcess with no output, for status calls
+_EMPTY_RESULT = SimpleNamespace(stdout='')
+
+
 class _RunCalls:
     def __init__(self) -> None:
         self.calls: list[dict[str, Any]] = []
@@ -28,13 +44,7 @@ class _RunCalls:
         self.calls.append(
             {'args': args, 'cwd': cwd, 'check': check, 'capture_output': capture_output, 'text': text},
         )
-
-        # Simulate a CompletedProcess-like with stdout for status calls
-        class _Res:
-            def __init__(self) -> None:
-                self.stdout = ''
-
-        return _Res()
+        return _EMPTY_RESULT
 
 
 def test_is_git_available_true(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -50,7 +60,6 @@ def test_is_git_available_false(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_fetch_includes_prune_by_default(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     # Arrange
     runner = _RunCalls()
-    monkeypatch.setattr(git.shutil, 'which', lambda _name: 'git')  ## type: ignore
     monkeypatch.setattr(git.subprocess, 'run', runner)
 
     # Act
@@ -66,7 +75,6 @@ def test_fetch_includes_prune_by_default(tmp_path: Path, monkeypatch: pytest.Mon
 
 def test_fetch_without_prune(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     runner = _RunCalls()
-    monkeypatch.setattr(git.shutil, 'which', lambda _name: 'git')  ## type: ignore
     monkeypatch.setattr(git.subprocess, 'run', runner)
 
     git.fetch(tmp_path, remote='upstream', prune=False)
@@ -76,7 +84,6 @@ def test_fetch_without_prune(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) ->
 
 def test_reset_hard_calls_git(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     runner = _RunCalls()
-    monkeypatch.setattr(git.shutil, 'which', lambda _name: 'git')  ## type: ignore
     monkeypatch.setattr(git.subprocess, 'run', runner)
 
     git.reset_hard(tmp_path, target_branch='origin/dev')
@@ -86,7 +93,6 @@ def test_reset_hard_calls_git(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -
 
 def test_fast_forward_calls_git(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     runner = _RunCalls()
-    monkeypatch.setattr(git.shutil, 'which', lambda _name: 'git')  ## type: ignore
     monkeypatch.setattr(git.subprocess, 'run', runner)
 
     git.fast_forward(tmp_path, remote='origin', branch='feature')
@@ -122,7 +128,6 @@ def test_is_clean_from_porcelain_output(tmp_path: Path, monkeypatch: pytest.Monk
         assert text is True
         return _Res('')
 
-    monkeypatch.setattr(git.shutil, 'which', lambda _name: 'git')  # type: ignore
     monkeypatch.setattr(git.subprocess, 'run', _fake_run)
 
     assert git.is_clean(tmp_path) is True
@@ -142,7 +147,6 @@ def test_is_clean_from_porcelain_output(tmp_path: Path, monkeypatch: pytest.Monk
 
 def test_commit_all_adds_and_commits(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     runner = _RunCalls()
-    monkeypatch.setattr(git.shutil, 'which', lambda _name: 'git')  # type: ignore
     monkeypatch.setattr(git.subprocess, 'run', runner)
 
     git.commit_all(tmp_path, message='test commit')
@@ -155,7 +159,6 @@ def test_commit_all_adds_and_commits(tmp_path: Path, monkeypatch: pytest.MonkeyP
 
 def test_push_with_and_without_upstream(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     runner = _RunCalls()
-    monkeypatch.setattr(git.shutil, 'which', lambda _name: 'git')  ## type: ignore
     monkeypatch.setattr(git.subprocess, 'run', runner)
 
     git.push(tmp_path, remote='origin', branch='main')
@@ -165,17 +168,29 @@ def test_push_with_and_without_upstream(tmp_path: Path, monkeypatch: pytest.Monk
     assert runner.calls[1]['args'] == ['git', 'push', 'origin', 'main', '--set-upstream']
 
 
-def test_dry_run_does_not_call_subprocess(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+# Every public operation that runs a git command, with the arguments it needs
+_GIT_OPS = [
+    pytest.param(git.fetch, {'remote': 'origin'}, id='fetch'),
+    pytest.param(git.reset_hard, {'target_branch': 'origin/main'}, id='reset_hard'),
+    pytest.param(git.fast_forward, {}, id='fast_forward'),
+    pytest.param(git.is_clean, {}, id='is_clean'),
+    pytest.param(git.commit_all, {'message': 'm'}, id='commit_all'),
+    pytest.param(git.push, {}, id='push'),
+]
+
+
+@pytest.mark.parametrize(('op', 'kwargs'), _GIT_OPS)
+def test_dry_run_does_not_call_subprocess(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    op: Callable[..., object],
+    kwargs: dict[str, str],
+) -> None:
     # Ensure all public functions honour dry_run flag
     runner = _RunCalls()
-    monkeypatch.setattr(git.shutil, 'which', lambda _name: 'git')  ## type: ignore
     monkeypatch.setattr(git.subprocess, 'run', runner)
 
-    git.fetch(tmp_path, remote='origin', dry_run=True)
-    git.reset_hard(tmp_path, target_branch='origin/main', dry_run=True)
-    git.fast_forward(tmp_path, dry_run=True)
-    git.commit_all(tmp_path, message='m', dry_run=True)
-    git.push(tmp_path, dry_run=True)
+    op(tmp_path, **kwargs, dry_run=True)
 
     assert runner.calls == []
 
@@ -188,29 +203,19 @@ def test_fetch_raises_when_git_missing(tmp_path: Path, monkeypatch: pytest.Monke
         git.fetch(tmp_path, remote='origin')
 
 
-def test_subprocess_errors_propagate(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.parametrize(('op', 'kwargs'), _GIT_OPS)
+def test_subprocess_errors_propagate(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    op: Callable[..., object],
+    kwargs: dict[str, str],
+) -> None:
     def _raise(*_args: object, **_kwargs: object):  # pyright: ignore[reportUnknownParameterType]
         raise _sub.CalledProcessError(returncode=1, cmd=['git', 'x'])
 
-    # Ensure git path resolves, but run fails
-    monkeypatch.setattr(git.shutil, 'which', lambda _name: 'git')  # type: ignore
+    # git resolves (see _git_on_path), but running it fails
     monkeypatch.setattr(git.subprocess, 'run', _raise)  # pyright: ignore[reportUnknownArgumentType]
 
-    # Each should propagate CalledProcessError
-    with pytest.raises(_sub.CalledProcessError):
-        git.fetch(tmp_path)
-
-    with pytest.raises(_sub.CalledProcessError):
-        git.reset_hard(tmp_path)
-
-    with pytest.raises(_sub.CalledProcessError):
-        git.fast_forward(tmp_path)
-
-    with pytest.raises(_sub.CalledProcessError):
-        git.is_clean(tmp_path)
-
-    with pytest.raises(_sub.CalledProcessError):
-        git.commit_all(tmp_path, message='m')
-
+    # CalledProcessError should propagate
     with pytest.raises(_sub.CalledProcessError):
-        git.push(tmp_path)
+        op(tmp_path, **kwargs)
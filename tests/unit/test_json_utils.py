@@ -6,11 +6,13 @@ from typing import Any
 
 import pytest
 
-from obelisk.json_utils import pretty_json, save_as_json
+from obelisk.json_utils import iter_pretty_json, pretty_json, save_as_json
 
 
 JsonLike = dict[str, Any] | list[Any] | str | int | float | bool | None
 
+_DATA_DIR = Path(__file__).resolve().parents[1] / 'data'
+
 
 def _read(p: Path) -> str:
     return p.read_text(encoding='utf-8')
@@ -84,8 +86,7 @@ def test_save_as_json_shrinks_mod_dicts_to_single_line(
 
 def test_save_as_json_reproduces_manifest1_formatting(tmp_path: Path) -> None:
     # Arrange: read the golden manifest fixture and re-serialize it
-    data_dir = Path(__file__).resolve().parents[1] / 'data'
-    src = data_dir / 'manifest1.json'
+    src = _DATA_DIR / 'manifest1.json'
     original = src.read_text(encoding='utf-8').strip()
 
     # Sanity: fixture should use tabs and LF newlines
@@ -205,3 +206,22 @@ def test_pretty_json_keeps_nested_inline_when_top_level_wrapped() -> None:
     result = pretty_json(obj, indent=2, sort_keys=True, max_line=80, expand_top_level=True)
 
     assert result == '{\n  "list": [ 1, 2 ],\n  "outer": { "inner": 1 }\n}'
+
+
+def test_iter_pretty_json_pieces_join_to_pretty_json() -> None:
+    obj = {'mod': {'name': 'x' * 50, 'tags': ['a', 'b']}, 'files': [{'filename': 'a.json', 'hash': 'md5:1:2'}]}
+
+    pieces = list(iter_pretty_json(obj, indent='\t', max_line=60, expand_top_level=True))
+
+    assert len(pieces) > 1
+    assert ''.join(pieces) == pretty_json(obj, indent='\t', max_line=60, expand_top_level=True)
+
+
+def test_pretty_json_wide_indent_collapses_child_only_if_it_fits_own_line() -> None:
+    # With a wide indent the parent's remaining space can exceed what a child has on a line of its own
+    obj: JsonLike = {'a': [{}]}
+
+    assert pretty_json(obj, indent=8, max_line=20) == '{ "a": [ {  } ] }'
+    assert pretty_json(obj, indent=8, max_line=16) == (
+        '{\n        "a": [\n                {\n\n                }\n        ]\n}'
+    )
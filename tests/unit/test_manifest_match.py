@@ -5,8 +5,11 @@ from pathlib import Path
 from obelisk.manifest import ManifestEntry, manifest_match, parse_manifest
 
 
+_DATA_DIR = Path(__file__).resolve().parents[1] / 'data'
+
+
 def _data_path(name: str) -> Path:
-    return Path(__file__).resolve().parents[1] / 'data' / name
+    return _DATA_DIR / name
 
 
 def test_manifest_match_two_copies_same_file() -> None:
@@ -114,3 +114,12 @@ def test_write_manifest_includes_hash(tmp_path: Path) -> None:
 
     assert 'format' not in data  # no formats provided at all
     assert data['files']['a.json'] == {'version': '1', 'hash': 'abc123'}
+
+
+def test_write_manifest_orders_files_by_name(tmp_path: Path) -> None:
+    entries = [ManifestEntry(filename=name, version='1') for name in ('c.json', 'a.json', 'b.json')]
+
+    path = tmp_path / '_manifest.json'
+    write_manifest(path, entries)
+
+    assert list(_read_json(path)['files']) == ['a.json', 'b.json', 'c.json']
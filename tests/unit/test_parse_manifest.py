@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from obelisk.manifest import ManifestEntry, parse_manifest
+from obelisk.manifest import ManifestEntry, parse_manifest, parse_manifest_by_name
+
+
+_DATA_DIR = Path(__file__).resolve().parents[1] / 'data'
 
 
 def _data_path(name: str) -> Path:
-    return Path(__file__).resolve().parents[1] / 'data' / name
+    return _DATA_DIR / name
 
 
 def test_parse_manifest_with_sample_file() -> None:
@@ -80,3 +83,24 @@ def test_parse_manifest_entries_sorted_by_filename(tmp_path: Path) -> None:
 
     filenames = [e.filename for e in entries]
     assert filenames == sorted(filenames)
+
+
+def test_parse_manifest_by_name_matches_parse_manifest(tmp_path: Path) -> None:
+    # Arrange: unsorted filenames with an inherited format
+    content = {
+        'format': '42',
+        'files': {
+            'zeta.json': {'version': '1.0'},
+            'alpha.json': {'version': '2.0', 'format': 'x'},
+        },
+    }
+    p = tmp_path / 'manifest.json'
+    p.write_text(__import__('json').dumps(content), encoding='utf-8')
+
+    # Act
+    by_name = parse_manifest_by_name(p)
+
+    # Assert: keys follow the file order and the entries are those parse_manifest gives
+    assert list(by_name) == ['zeta.json', 'alpha.json']
+    assert by_name['zeta.json'].format == '42'
+    assert sorted(by_name.values(), key=lambda e: e.filename) == parse_manifest(p)
@@ -3,8 +3,9 @@ from __future__ import annotations
 import hashlib
 from typing import TYPE_CHECKING
 
-from obelisk.scanner import create_manifest_from_folder
-from tests.mocks.files import patch_path_glob_for_folder
+from obelisk import scanner
+from obelisk.scanner import ScanCache, create_manifest_from_folder
+from tests.mocks.files import patch_scandir_for_folder
 
 
 if TYPE_CHECKING:
@@ -148,12 +149,35 @@ def test_create_manifest_from_folder_sorts_entries_correctly(
     b.write_text('{"version":"2"}', encoding='utf-8')
     c.write_bytes(b'pngbytes')
 
-    scrambled = [c, b, a]
+    scrambled = [c.name, b.name, a.name]
 
-    patch_path_glob_for_folder(monkeypatch, root, '*.*', scrambled)
+    patch_scandir_for_folder(monkeypatch, root, scrambled)
 
     entries = create_manifest_from_folder(root)
     filenames = [e.filename for e in entries]
 
     # Despite scrambled source order, result should be sorted by filename
     assert filenames == ['a.json', 'b.json', 'c.png']
+
+
+def test_create_manifest_from_folder_scan_cache_reuses_unchanged_entries(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root = tmp_path / 'root'
+    root.mkdir()
+
+    (root / 'a.json').write_text('{"version":"1"}', encoding='utf-8')
+    (root / 'b.png').write_bytes(b'pngbytes')
+
+    # Files written by the test are brand new, so allow caching them straight away
+    monkeypatch.setattr(scanner, '_RACY_WINDOW_NS', 0)
+    cache = ScanCache()
+
+    first = create_manifest_from_folder(root, scan_cache=cache)
+    (root / 'b.png').write_bytes(b'changed-pngbytes')
+    second = create_manifest_from_folder(root, scan_cache=cache)
+
+    # Unchanged file is served from the cache, changed file is re-hashed
+    assert second[0] is first[0]
+    assert second[1].hash == _expected_hash(b'changed-pngbytes')